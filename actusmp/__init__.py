@@ -12,6 +12,7 @@ __license__ = "Apache 2.0"
 
 
 from actusmp.codegen.enums import TargetLanguage
+from actusmp.codegen.generator import GeneratorOptions
 from actusmp.codegen.writer import write
 from actusmp.model import Contract
 from actusmp.model import ContractSet
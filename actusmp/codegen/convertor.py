@@ -1,7 +1,11 @@
+import hashlib
 import re
+import typing
 
+from actusmp.model import Contract
 from actusmp.model import Enum
 from actusmp.model import EnumMember
+from actusmp.model import Function
 from actusmp.model import ScalarType
 from actusmp.model import Term
 
@@ -42,6 +46,118 @@ def to_pascal_case(name: str, separator: str = '_'):
     return r
 
 
+class SymbolTable():
+    """Memoising facade over the set of conversion functions, passed to templates as utils.
+
+    Each conversion is computed once per set of arguments and reused across templates and
+    target languages.  Hashable arguments (e.g. names) are keyed by value, unhashable ones
+    (i.e. entities) by identity, hence a table retains the arguments of each entity
+    conversion it memoises.  A table is thus scoped to a single generation run.
+
+    """
+    def __getattr__(self, name: str) -> typing.Any:
+        """Instance attribute accessor: memoises public conversion functions upon first access."""
+        target = globals().get(name)
+        if name.startswith("to_") and callable(target):
+            target = _memoise(target)
+        elif name not in _TYPES:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        setattr(self, name, target)
+
+        return target
+
+
+def to_codec_terms(definition: Contract) -> typing.List[Term]:
+    """Maps a contract's termset to the ordered set of terms encoded by a binary termset codec.
+
+    All terms are encoded other than the contract type, which is implied by the codec.
+
+    """
+    return [i for i in definition.term_set or [] if i.identifier != "contractType"]
+
+
+def to_codec_wire_type(term: Term) -> str:
+    """Maps an Actus term's type to the wire type of its (array element) values within a binary termset codec.
+
+    Cycle, Period & ContractReference values are encoded as text, i.e. as per their Actus representation.
+
+    """
+    if term.scalar_type in (ScalarType.Enum, ScalarType.Real, ScalarType.Timestamp):
+        return term.scalar_type.name
+    return ScalarType.Varchar.name
+
+
+def to_store_dtype(term: Term) -> str:
+    """Maps an Actus term's type to the on-disk type of a portfolio store column.
+
+    Cycle, Period & ContractReference values are stored as text, i.e. as per their Actus representation.
+
+    """
+    if term.scalar_type == ScalarType.Timestamp:
+        return "int64"
+    elif term.scalar_type in (ScalarType.Enum, ScalarType.Real):
+        return to_py_column_dtype(term)
+    return "varchar"
+
+
+def to_store_terms(definition: Contract) -> typing.List[Term]:
+    """Maps a contract's termset to the ordered set of terms stored as portfolio store columns.
+
+    Scalar terms are stored, i.e. array terms are excluded.
+
+    """
+    return [i for i in to_codec_terms(definition) if not i.is_array]
+
+
+def to_store_layout_hash(definition: Contract) -> str:
+    """Maps a contract's termset to a hash of the column layout of a portfolio store.
+
+    """
+    h = hashlib.sha256()
+    for term in to_store_terms(definition):
+        h.update(f"{term.identifier}:{to_store_dtype(term)}|".encode())
+
+    return h.hexdigest()
+
+
+def to_enum_lookup(definition: typing.Union[Enum, Term]) -> typing.List[typing.Tuple[str, EnumMember]]:
+    """Maps an enumeration to a set of (upper cased key, member) pairs for case-insensitive parsing.
+
+    Keys are member acronyms, identifiers & aliases - the first member declaring a key wins.
+
+    """
+    lookup = dict()
+    for member in definition.members:
+        lookup.setdefault(member.acronym.upper(), member)
+    for member in definition.members:
+        lookup.setdefault(member.identifier.upper(), member)
+    for member in definition.members:
+        for alias in member.aliases:
+            lookup.setdefault(alias.upper(), member)
+
+    return list(lookup.items())
+
+
+def to_enum_member_keys(definition: typing.Union[Enum, Term]) -> typing.List[typing.Tuple[EnumMember, typing.List[str]]]:
+    """Groups an enumeration's lookup keys by member, omitting members without a key.
+
+    """
+    keys = {id(i): (i, []) for i in definition.members}
+    for key, member in to_enum_lookup(definition):
+        keys[id(member)][1].append(key)
+
+    return [i for i in keys.values() if i[1]]
+
+
+def to_func_module_name(func: Function) -> str:
+    """Maps a function to the (case preserving) name of the module into which its stub is emitted, e.g. 'pof_PR_2'.
+
+    """
+    name = f"{func.func_type.name.lower()}_{func.event_type}"
+
+    return f"{name}_{func.suffix}" if func.suffix else name
+
+
 def to_py_type(term: Term) -> str:
     """Maps an Actus term's type to it's pythonic equivalent.
 
@@ -70,20 +186,39 @@ def to_py_type(term: Term) -> str:
         return _map(term.scalar_type)
 
 
+def to_py_column_dtype(term: Term) -> str:
+    """Maps an Actus term's type to the numpy dtype of a columnar portfolio column.
+
+    """
+    if term.is_array:
+        return "object"
+    elif term.scalar_type == ScalarType.Enum:
+        options = [int(i.option) for i in term.allowed_values]
+        return "int8" if -128 < min(options) and max(options) < 128 else "int16"
+    elif term.scalar_type == ScalarType.Real:
+        return "float64"
+    elif term.scalar_type == ScalarType.Timestamp:
+        return "datetime64[s]"
+    else:
+        return "object"
+
+
+def to_py_column_kind(term: Term) -> str:
+    """Maps an Actus term's type to the encoding applied to a columnar portfolio column.
+
+    """
+    if term.is_array or term.scalar_type not in (ScalarType.Enum, ScalarType.Real, ScalarType.Timestamp):
+        return "object"
+    return term.scalar_type.name.lower()
+
+
 def to_py_default(term: Term) -> str:
     """Maps an Actus term's default value to it's pythonic equivalent.
 
     """
-    def get_enum_default_acronym():
-        for member in term.allowed_values:
-            if member.is_match(term.default):
-                return member.acronym
-        print(f"WARNING: enum member default is incorrect, reverting to option 0 :: {term}")
-        return term.allowed_values[0].acronym
-
     if term.default:
         if term.scalar_type == ScalarType.Enum:
-            return f"enums.{to_camel_case(term.identifier)}.{get_enum_default_acronym()}"
+            return f"enums.{to_camel_case(term.identifier)}.{_get_enum_default_acronym(term)}"
         elif term.scalar_type == ScalarType.Period:
             return "None"
         elif term.scalar_type == ScalarType.Real:
@@ -143,20 +278,27 @@ def to_rs_type(term: Term) -> str:
         return _map(term.scalar_type)
 
 
+def to_rs_codec_type(term: Term) -> str:
+    """Maps an Actus term's type to the type of its value within a binary termset codec wire record.
+
+    """
+    typedef = {
+        ScalarType.Enum.name: "i16",
+        ScalarType.Real.name: "f64",
+        ScalarType.Timestamp.name: "i64",
+        ScalarType.Varchar.name: "String",
+    }[to_codec_wire_type(term)]
+
+    return f"Vec<{typedef}>" if term.is_array else typedef
+
+
 def to_rs_default(term: Term) -> str:
     """Maps an Actus term's default value to it's rusty equivalent.
 
     """
-    def get_enum_default_acronym():
-        for member in term.allowed_values:
-            if member.is_match(term.default):
-                return member.acronym
-        print(f"WARNING: enum member default is incorrect, reverting to option 0 :: {term}")
-        return term.allowed_values[0].acronym
-
     if term.default:
         if term.scalar_type == ScalarType.Enum:
-            return f"enums.{to_camel_case(term.identifier)}.{get_enum_default_acronym()}"
+            return f"enums.{to_camel_case(term.identifier)}.{_get_enum_default_acronym(term)}"
         elif term.scalar_type == ScalarType.Period:
             return "None"
         elif term.scalar_type == ScalarType.Real:
@@ -215,17 +357,24 @@ def to_ts_type(term: Term) -> str:
         return _map(term.scalar_type)
 
 
+def to_ts_codec_type(term: Term) -> str:
+    """Maps an Actus term's type to the type of its value within a binary termset codec wire record.
+
+    """
+    typedef = {
+        ScalarType.Enum.name: f"enums.{to_camel_case(term.identifier)}",
+        ScalarType.Real.name: "number",
+        ScalarType.Timestamp.name: "Date",
+        ScalarType.Varchar.name: "string",
+    }[to_codec_wire_type(term)]
+
+    return f"Array<{typedef}>" if term.is_array else typedef
+
+
 def to_ts_default(term: Term) -> str:
     """Maps an Actus term's default value to it's typescript equivalent.
 
     """
-    def get_enum_default_acronym():
-        for member in term.allowed_values:
-            if member.is_match(term.default):
-                return member.acronym
-        print(f"WARNING: enum member default is incorrect, reverting to option 0 :: {term}")
-        return term.allowed_values[0].acronym
-
     if term.is_array:
         return "[]"
 
@@ -233,7 +382,7 @@ def to_ts_default(term: Term) -> str:
         if term.scalar_type == ScalarType.Cycle:
             return ""
         elif term.scalar_type == ScalarType.Enum:
-            return f"enums.{to_camel_case(term.identifier)}.{get_enum_default_acronym()}"
+            return f"enums.{to_camel_case(term.identifier)}.{_get_enum_default_acronym(term)}"
         elif term.scalar_type == ScalarType.Period:
             return ""
         elif term.scalar_type == ScalarType.Real:
@@ -291,3 +440,48 @@ def to_underscore_case(target: str):
     r = r.lower()
 
     return r
+
+
+def _get_enum_default_acronym(term: Term) -> str:
+    """Returns acronym of member matched by an enum term's default value.
+
+    """
+    for member in term.allowed_values:
+        if member.is_match(term.default):
+            return member.acronym
+    print(f"WARNING: enum member default is incorrect, reverting to option 0 :: {term}")
+    return term.allowed_values[0].acronym
+
+
+def _memoise(func: typing.Callable) -> typing.Callable:
+    """Wraps a conversion function such that it is computed once per set of arguments.
+
+    """
+    cache = dict()
+    cache_by_id = dict()
+
+    def _wrapper(*args, **kwargs):
+        key = (args, tuple(kwargs.items())) if kwargs else args
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = func(*args, **kwargs)
+            return result
+        except TypeError:
+            pass
+
+        key = (tuple(map(id, args)), tuple((k, id(v)) for k, v in kwargs.items()))
+        try:
+            return cache_by_id[key][0]
+        except KeyError:
+            # Retain arguments so that identity keys remain valid.
+            cache_by_id[key] = func(*args, **kwargs), args, kwargs
+            return cache_by_id[key][0]
+
+    return _wrapper
+
+
+# Set of non-function names exposed to templates via a symbol table.
+_TYPES: typing.Set[str] = {
+    "ScalarType",
+}
@@ -24,11 +24,49 @@ class TargetGenerator(enum.Enum):
     FuncStubIndex = enum.auto()
     FuncStubDoGetSchedule = enum.auto()
     FuncStubDoExecuteStep = enum.auto()
+    FuncBatchIndex = enum.auto()
+    FuncStubBatchPOF = enum.auto()
+    FuncStubBatchSTF = enum.auto()
+    Portfolio = enum.auto()
+    PortfolioStore = enum.auto()
     StateSpace = enum.auto()
+    StateSpaceArray = enum.auto()
     Termset = enum.auto()
+    TermsetCodec = enum.auto()
     TermsetIndex = enum.auto()
 
 
+class WriteStatus(enum.Enum):
+    """Enumeration: set of outcomes of writing a code block to file system.
+
+    """
+    # File did not previously exist.
+    created = enum.auto()
+
+    # File existed with identical content and was left untouched.
+    unchanged = enum.auto()
+
+    # File existed with different content and was overwritten.
+    updated = enum.auto()
+
+
+class OutputSink(enum.Enum):
+    """Enumeration: set of supported destinations of emitted code.
+
+    """
+    # Files are written one by one into a directory.
+    directory = enum.auto()
+
+    # Files are buffered & written in bulk into a directory, each sub-directory being created once.
+    batched = enum.auto()
+
+    # Files are streamed into a single tar or zip archive.
+    archive = enum.auto()
+
+    # Files are retained in memory, i.e. nothing is written to file system.
+    memory = enum.auto()
+
+
 # Map: TargetLanguage <-> template subfolder name.
 LANG_TEMPLATE_SUBFOLDER: dict = {
     TargetLanguage.python: "py",
@@ -37,8 +75,62 @@ LANG_TEMPLATE_SUBFOLDER: dict = {
 }
 
 
+# Map: TargetLanguage <-> name of upstream repo into which code is emitted.
+LANG_UPSTREAM_REPO: dict = {
+    TargetLanguage.python: "actus-core-py",
+    TargetLanguage.rust: "actus-core-rs",
+    TargetLanguage.typescript: "actus-core-ts",
+}
+
+
 # Map: Generator type <-> ACTUS function type.
 GENERATOR_ACTUS_FN = {
     TargetGenerator.FuncStubPOF: FunctionType.POF,
     TargetGenerator.FuncStubSTF: FunctionType.STF,
+    TargetGenerator.FuncStubBatchPOF: FunctionType.POF,
+    TargetGenerator.FuncStubBatchSTF: FunctionType.STF,
+}
+
+
+# Map: Optional generator type <-> set of optional generators whose output the generator's output imports.
+GENERATOR_DEPENDENCIES: dict = {
+    TargetGenerator.FuncBatchIndex: (TargetGenerator.FuncStubBatchPOF, TargetGenerator.FuncStubBatchSTF),
+    TargetGenerator.FuncStubBatchPOF: (TargetGenerator.FuncBatchIndex, TargetGenerator.Portfolio),
+    TargetGenerator.FuncStubBatchSTF: (TargetGenerator.FuncBatchIndex, TargetGenerator.Portfolio),
+    TargetGenerator.PortfolioStore: (TargetGenerator.Portfolio, ),
+}
+
+
+# Map: Generator type <-> set of index (or dispatch) generators whose output references the generator's output.
+GENERATOR_INDEX: dict = {
+    TargetGenerator.Enum: (TargetGenerator.EnumIndex, ),
+    TargetGenerator.FuncStubBatchPOF: (TargetGenerator.FuncBatchIndex, ),
+    TargetGenerator.FuncStubBatchSTF: (TargetGenerator.FuncBatchIndex, ),
+    TargetGenerator.FuncStubDoExecuteStep: (TargetGenerator.FuncStubIndex, ),
+    TargetGenerator.FuncStubDoGetSchedule: (TargetGenerator.FuncStubIndex, ),
+    TargetGenerator.FuncStubIndex: (TargetGenerator.FuncIndex, ),
+    TargetGenerator.FuncStubPOF: (TargetGenerator.FuncStubIndex, TargetGenerator.FuncStubDoExecuteStep),
+    TargetGenerator.FuncStubSTF: (TargetGenerator.FuncStubIndex, TargetGenerator.FuncStubDoExecuteStep),
+    TargetGenerator.Termset: (TargetGenerator.TermsetIndex, ),
+}
+
+
+# Map: Generator type <-> set of supported languages (unmapped generators support all).
+GENERATOR_LANGS: dict = {
+    TargetGenerator.FuncBatchIndex: {TargetLanguage.python},
+    TargetGenerator.FuncStubBatchPOF: {TargetLanguage.python},
+    TargetGenerator.FuncStubBatchSTF: {TargetLanguage.python},
+    TargetGenerator.Portfolio: {TargetLanguage.python},
+}
+
+
+# Set of generators that execute only when explicitly requested.
+OPTIONAL_GENERATORS: set = {
+    TargetGenerator.FuncBatchIndex,
+    TargetGenerator.FuncStubBatchPOF,
+    TargetGenerator.FuncStubBatchSTF,
+    TargetGenerator.Portfolio,
+    TargetGenerator.PortfolioStore,
+    TargetGenerator.StateSpaceArray,
+    TargetGenerator.TermsetCodec,
 }
@@ -1,15 +1,43 @@
+import dataclasses
 import pathlib
+import typing
 
 from actusmp.codegen import convertor
 from actusmp.codegen.enums import TargetGenerator
 from actusmp.codegen.enums import TargetLanguage
 from actusmp.codegen.enums import GENERATOR_ACTUS_FN
+from actusmp.codegen.enums import GENERATOR_DEPENDENCIES
+from actusmp.codegen.enums import GENERATOR_INDEX
+from actusmp.codegen.enums import GENERATOR_LANGS
 from actusmp.codegen.enums import LANG_TEMPLATE_SUBFOLDER
+from actusmp.codegen.enums import OPTIONAL_GENERATORS
+from actusmp.model import Contract
 from actusmp.model import Dictionary
-from actusmp.model import IterableEntity
+from actusmp.model import EnumMember
+from actusmp.model import Function
+from actusmp.model import FunctionSet
+from actusmp.model import FunctionType
 from actusmp.utils import fsys
 
 
+@dataclasses.dataclass
+class GeneratorOptions():
+    """Set of options controlling the code emitted by the generator set.
+
+    """
+    # Set of acronyms of contracts for which per contract code is emitted (all if empty).
+    contracts: typing.FrozenSet[str] = frozenset()
+
+    # Set of optional generators to be executed in addition to the default set.
+    extra_generators: typing.FrozenSet[TargetGenerator] = frozenset()
+
+    # Set of generators to be executed, together with the index generators referencing their output (all if empty).
+    generators: typing.FrozenSet[TargetGenerator] = frozenset()
+
+    # Flag indicating whether python termset classes are emitted as slotted dataclasses (requires python 3.10+).
+    py_slotted_termsets: bool = False
+
+
 class GeneratorContext():
     """Contextual information passed amongst the generator set.
 
@@ -19,7 +47,10 @@ class GeneratorContext():
         lang: TargetLanguage,
         typeof: TargetGenerator,
         dictionary: Dictionary,
-        path_to_java_funcs: pathlib.Path
+        path_to_java_funcs: pathlib.Path,
+        funcset: typing.Optional[FunctionSet] = None,
+        options: typing.Optional[GeneratorOptions] = None,
+        symbols: typing.Optional[convertor.SymbolTable] = None
     ):
         """Instance constructor.
 
@@ -27,12 +58,18 @@ class GeneratorContext():
         :param typeof: Target generator type.
         :param dictionary: Actus dictionary wrapper.
         :param path_to_java_funcs: Path to core Java implementation.
+        :param funcset: Set of functions declared in core Java implementation.
+        :param options: Options controlling emitted code.
+        :param symbols: Memoised conversion functions shared across the generators of a run (one per context if None).
 
         """
         self.lang = lang
         self.typeof = typeof
         self.dictionary = dictionary
         self.path_to_java_funcs = path_to_java_funcs
+        self.funcset = funcset
+        self.options = options or GeneratorOptions()
+        self.symbols = symbols or convertor.SymbolTable()
 
 
 def generate(ctx: GeneratorContext):
@@ -42,48 +79,190 @@ def generate(ctx: GeneratorContext):
     :returns: A generated code block.
 
     """
-    # Set template.
-    tmpl = _get_template(ctx)
+    # Yield 2 member tuple: (code block, domain entity).
+    for entity in get_entities(ctx):
+        yield render(ctx, entity), entity
+
+
+def get_generators(lang: TargetLanguage, options: GeneratorOptions) -> typing.List[TargetGenerator]:
+    """Returns set of generators to be executed for a target language.
+
+    :param lang: Target programming language.
+    :param options: Options controlling emitted code.
+    :returns: A list of generator types.
+
+    """
+    extra = _get_extra_generators(options)
+    selected = _get_selected_generators(options)
+
+    return [
+        i for i in TargetGenerator
+        if lang in GENERATOR_LANGS.get(i, TargetLanguage) and
+        (i not in OPTIONAL_GENERATORS or i in extra or i in selected) and
+        (not selected or i in selected)
+    ]
+
 
-    # Set code block factory.
-    if ctx.typeof in (TargetGenerator.FuncStubPOF, TargetGenerator.FuncStubSTF):
-        factory = _gen_from_java_funcs(tmpl, ctx)
+def get_entities(ctx: GeneratorContext) -> list:
+    """Returns set of domain entities for each of which a code block will be emitted.
+
+    :param ctx: Generator contextual information.
+    :returns: A list of domain entities.
+
+    """
+    if ctx.typeof in GENERATOR_ACTUS_FN:
+        return list(_yield_java_funcs(ctx))
+
+    entity = _get_entity(ctx)
+    if entity is ctx.dictionary:
+        return [entity]
+    elif entity is ctx.dictionary.contract_set:
+        return list(_yield_contracts(ctx))
     else:
-        entity = _get_entity(ctx)
-        if entity == ctx.dictionary:
-            factory = _gen_from_dictionary(tmpl, entity)
-        else:
-            factory = _gen_from_iterable_entity(tmpl, entity)
+        return list(entity)
+
+
+def render(ctx: GeneratorContext, entity) -> str:
+    """Returns code block emitted by a generator for a domain entity.
+
+    :param ctx: Generator contextual information.
+    :param entity: Domain entity as returned by get_entities.
+    :returns: A generated code block.
+
+    """
+    tmpl = _get_template(ctx)
+    utils = ctx.symbols
+    if ctx.typeof in GENERATOR_ACTUS_FN:
+        defn, _, event_type, suffix = entity
+        return tmpl.render(
+            defn=defn, event_type=event_type, suffix=suffix, options=ctx.options, utils=utils
+            )
+    elif ctx.typeof in (TargetGenerator.FuncStubDoExecuteStep, TargetGenerator.FuncStubIndex):
+        dispatch = _get_dispatch_table(ctx, entity)
+        funcs = [i for f_type in FunctionType for i in _get_funcset(ctx).get_functions(entity.acronym, f_type)]
+        return tmpl.render(
+            defn=entity, dictionary=ctx.dictionary, dispatch=dispatch, funcs=funcs, options=ctx.options, utils=utils
+            )
+    elif ctx.typeof == TargetGenerator.FuncBatchIndex:
+        handlers = list(_yield_batch_handlers(ctx))
+        return tmpl.render(
+            defn=entity, dictionary=entity, handlers=handlers, options=ctx.options, utils=utils
+            )
+    elif entity is ctx.dictionary:
+        return tmpl.render(defn=entity, dictionary=entity, options=ctx.options, utils=utils)
+    else:
+        return tmpl.render(defn=entity, dictionary=ctx.dictionary, options=ctx.options, utils=utils)
 
-    # Yield 2 member tuple: (code block, domain entity).
-    for entity, code_block in factory:
-        yield code_block, entity
 
+def _get_dispatch_table(
+    ctx: GeneratorContext,
+    defn: Contract
+) -> typing.List[typing.Tuple[typing.Optional[EnumMember], typing.List[Function], typing.List[Function]]]:
+    """Returns set of (event type, pay off function variants, state transition function variants) indexed by event type option.
 
-def _gen_from_dictionary(tmpl: pathlib.Path, dictionary: Dictionary):
-    """Yields a single generated code block.
+    Variants, i.e. functions distinguished by a numeric suffix, are ordered by suffix.  Functions
+    whose event type is not declared within the event type enumeration are excluded.
 
     """
-    yield dictionary, tmpl.render(defn=dictionary, dictionary=dictionary, utils=convertor)
+    funcset = _get_funcset(ctx)
+    members = {i.option: i for i in ctx.dictionary.contract_event_type.members}
+    variants = {f_type: dict() for f_type in FunctionType}
+    for f_type in FunctionType:
+        for func in funcset.get_functions(defn.acronym, f_type):
+            variants[f_type].setdefault(func.event_type, []).append(func)
 
+    return [
+        (
+            members.get(option),
+            variants[FunctionType.POF].get(members[option].acronym, []) if option in members else [],
+            variants[FunctionType.STF].get(members[option].acronym, []) if option in members else [],
+        )
+        for option in range(max(members) + 1)
+    ]
 
-def _gen_from_iterable_entity(tmpl: pathlib.Path, definitions: IterableEntity):
-    """Yields a set of generated code blocks.
+
+def _get_funcset(ctx: GeneratorContext) -> FunctionSet:
+    """Returns set of functions declared within the actus-core reference implementation.
+
+    """
+    if ctx.funcset is None:
+        return fsys.get_funcset(ctx.path_to_java_funcs)
+
+    return ctx.funcset
+
+
+def _get_extra_generators(options: GeneratorOptions) -> typing.Set[TargetGenerator]:
+    """Returns set of optional generators to be executed extended by the optional generators they depend upon.
+
+    """
+    extra = set(options.extra_generators)
+    pending = list(extra)
+    while pending:
+        for dependency in GENERATOR_DEPENDENCIES.get(pending.pop(), ()):
+            if dependency not in extra:
+                extra.add(dependency)
+                pending.append(dependency)
+
+    return extra
+
+
+def _get_selected_generators(options: GeneratorOptions) -> typing.Set[TargetGenerator]:
+    """Returns set of selected generators extended by the index generators that reference their output.
 
     """
-    for defn in definitions:
-        yield defn, tmpl.render(defn=defn, utils=convertor)
+    selected = set(options.generators)
+    pending = list(selected)
+    while pending:
+        for index in GENERATOR_INDEX.get(pending.pop(), ()):
+            if index not in selected:
+                selected.add(index)
+                pending.append(index)
+
+    return selected
 
 
-def _gen_from_java_funcs(tmpl: pathlib.Path, ctx: GeneratorContext):
-    """Returns generator yielding set of function stubs.
+def _yield_contracts(ctx: GeneratorContext) -> typing.Iterator[Contract]:
+    """Yields set of contracts for which per contract code is emitted.
+
+    """
+    for defn in ctx.dictionary.contract_set:
+        if not ctx.options.contracts or defn.acronym in ctx.options.contracts:
+            yield defn
+
+
+def _yield_batch_handlers(ctx: GeneratorContext):
+    """Yields set of (contract, event type, has payoff function, has state transition function) batch handlers.
+
+    Function variants (i.e. those with a numeric suffix) are excluded as selecting between them
+    is contract logic rather than dispatch logic.  Functions whose event type is not declared
+    within the event type enumeration are excluded.
+
+    """
+    funcset = _get_funcset(ctx)
+    declared = {i.acronym for i in ctx.dictionary.contract_event_type.members}
+    for defn in ctx.dictionary.contract_set:
+        event_types = {
+            f_type: {
+                i.event_type for i in funcset.get_functions(defn.acronym, f_type)
+                if not i.suffix and i.event_type in declared
+            }
+            for f_type in FunctionType
+        }
+        for event_type in sorted(set.union(*event_types.values())):
+            has_pof = event_type in event_types[FunctionType.POF]
+            has_stf = event_type in event_types[FunctionType.STF]
+            yield defn, event_type, has_pof, has_stf
+
+
+def _yield_java_funcs(ctx: GeneratorContext):
+    """Yields set of function stub entities.
 
     """
     f_type = GENERATOR_ACTUS_FN[ctx.typeof]
-    f_iterator = fsys.yield_funcset(ctx.dictionary, ctx.path_to_java_funcs, f_type)
-    for defn, event_type, suffix in f_iterator:
-        yield (defn, f_type, event_type, suffix), \
-              tmpl.render(defn=defn, event_type=event_type, suffix=suffix, utils=convertor)
+    funcset = _get_funcset(ctx)
+    for defn in _yield_contracts(ctx):
+        for func in funcset.get_functions(defn.acronym, f_type):
+            yield defn, f_type, func.event_type, func.suffix
 
 
 def _get_entity(ctx: GeneratorContext):
@@ -98,18 +277,32 @@ def _get_entity(ctx: GeneratorContext):
         TargetGenerator.FuncStubDoGetSchedule,
         TargetGenerator.FuncStubPOF,
         TargetGenerator.FuncStubSTF,
+        TargetGenerator.FuncStubBatchPOF,
+        TargetGenerator.FuncStubBatchSTF,
+        TargetGenerator.Portfolio,
+        TargetGenerator.PortfolioStore,
         TargetGenerator.Termset,
+        TargetGenerator.TermsetCodec,
     ):
         return ctx.dictionary.contract_set
 
     return ctx.dictionary
 
 
-def _get_template(ctx: GeneratorContext):
-    """Returns template over which generation will execute.
+def get_template_name(ctx: GeneratorContext) -> str:
+    """Returns name of template over which generation will execute.
+
+    :param ctx: Generator contextual information.
+    :returns: A template file name.
 
     """
     fname: str = convertor.to_underscore_case(ctx.typeof.name).lower()
-    fname = f"{LANG_TEMPLATE_SUBFOLDER[ctx.lang]}_{fname}.txt"
 
-    return fsys.get_template(ctx.lang, fname)
+    return f"{LANG_TEMPLATE_SUBFOLDER[ctx.lang]}_{fname}.txt"
+
+
+def _get_template(ctx: GeneratorContext):
+    """Returns template over which generation will execute.
+
+    """
+    return fsys.get_template(ctx.lang, get_template_name(ctx))
@@ -0,0 +1,95 @@
+import contextlib
+import dataclasses
+import os
+import time
+import typing
+
+
+@dataclasses.dataclass
+class Span():
+    """A timed unit of work emitted to registered hooks.
+
+    """
+    # Category of unit of work, e.g. 'dictionary' | 'funcset' | 'render' | 'write'.
+    category: str
+
+    # Name of unit of work, e.g. 'types/terms/pam.py'.
+    name: str
+
+    # Start time in seconds as measured by a monotonic clock.
+    started: float
+
+    # Wall time in seconds.
+    elapsed: float
+
+    # Identifier of process within which unit of work was executed.
+    pid: int
+
+    # Contextual attributes, e.g. lang, generator, template, bytes.
+    attrs: dict
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"span|{self.category}|{self.name}|{self.elapsed:.6f}"
+
+
+# Set of registered hooks.
+_HOOKS: typing.List[typing.Callable[[Span], None]] = []
+
+
+def emit(span: Span):
+    """Passes a span to each registered hook.
+
+    :param span: A timed unit of work.
+
+    """
+    for hook in _HOOKS:
+        hook(span)
+
+
+def is_active() -> bool:
+    """Returns flag indicating whether at least one hook is registered.
+
+    """
+    return len(_HOOKS) > 0
+
+
+def register(hook: typing.Callable[[Span], None]):
+    """Registers a hook to be invoked with each span emitted during code generation.
+
+    :param hook: A callable accepting a span.
+
+    """
+    _HOOKS.append(hook)
+
+
+def unregister(hook: typing.Callable[[Span], None]):
+    """Unregisters a previously registered hook.
+
+    :param hook: A callable accepting a span.
+
+    """
+    _HOOKS.remove(hook)
+
+
+@contextlib.contextmanager
+def span(category: str, name: str, **attrs):
+    """Context manager: times enclosed unit of work and emits it to registered hooks.
+
+    The yielded attributes may be extended by the enclosed block, e.g. with bytes written.
+    When no hook is registered the unit of work is not timed.
+
+    :param category: Category of unit of work.
+    :param name: Name of unit of work.
+    :param attrs: Contextual attributes.
+
+    """
+    if not _HOOKS:
+        yield attrs
+        return
+
+    started = time.perf_counter()
+    try:
+        yield attrs
+    finally:
+        emit(Span(category, name, started, time.perf_counter() - started, os.getpid(), attrs))
@@ -0,0 +1,101 @@
+import collections
+import json
+import pathlib
+import typing
+
+from actusmp.codegen import hooks
+
+
+# Set of (category, attribute) pairs over which spans are aggregated.
+_DIMENSIONS: typing.Tuple[typing.Tuple[str, typing.Optional[str]]] = (
+    ("dictionary", None),
+    ("funcset", None),
+    ("render", "lang"),
+    ("render", "generator"),
+    ("render", "template"),
+    ("write", "lang"),
+    ("write", "generator"),
+    ("write", "status"),
+)
+
+
+class Profiler():
+    """Hook that records spans emitted during code generation.
+
+    """
+    def __init__(self):
+        """Instance constructor.
+
+        """
+        self.spans: typing.List[hooks.Span] = []
+
+    def __call__(self, span: hooks.Span):
+        """Hook entry point: records a span."""
+        self.spans.append(span)
+
+    def __enter__(self) -> "Profiler":
+        """Context entry: registers hook."""
+        hooks.register(self)
+        return self
+
+    def __exit__(self, *args):
+        """Context exit: unregisters hook."""
+        hooks.unregister(self)
+
+    def get_summary(self) -> str:
+        """Returns a table of wall time, call counts & bytes written aggregated by dimension.
+
+        :returns: A formatted table.
+
+        """
+        rows = [("stage", "key", "calls", "wall (ms)", "bytes")]
+        for category, attr in _DIMENSIONS:
+            stats = collections.defaultdict(lambda: [0, 0.0, 0])
+            for span in self.spans:
+                if span.category == category:
+                    stat = stats[span.attrs.get(attr, "-") if attr else "total"]
+                    stat[0] += 1
+                    stat[1] += span.elapsed
+                    stat[2] += span.attrs.get("bytes", 0)
+            for key, (calls, elapsed, size) in sorted(stats.items(), key=lambda i: -i[1][1]):
+                stage = f"{category}|{attr}" if attr else category
+                rows.append((stage, str(key), str(calls), f"{elapsed * 1000:.2f}", str(size)))
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+        return "\n".join(
+            "  ".join(j.ljust(widths[i]) if i < 2 else j.rjust(widths[i]) for i, j in enumerate(row))
+            for row in rows
+        )
+
+    def get_trace(self) -> dict:
+        """Returns recorded spans in Chrome trace event format.
+
+        :returns: A trace loadable by chrome://tracing or Perfetto.
+
+        """
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.started * 1e6,
+                    "dur": span.elapsed * 1e6,
+                    "pid": span.pid,
+                    "tid": span.pid,
+                    "args": span.attrs,
+                }
+                for span in self.spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write_trace(self, fpath: pathlib.Path):
+        """Writes recorded spans to file system in Chrome trace event format.
+
+        :param fpath: Target file path.
+
+        """
+        with open(fpath, "w") as fstream:
+            json.dump(self.get_trace(), fstream, default=str)
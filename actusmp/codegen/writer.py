@@ -1,38 +1,350 @@
+import concurrent.futures
+import dataclasses
+import os
 import pathlib
+import time
+import typing
 
 from actusmp.codegen import convertor
 from actusmp.codegen import generator
+from actusmp.codegen import hooks
 from actusmp.codegen.enums import TargetGenerator
 from actusmp.codegen.enums import TargetLanguage
+from actusmp.codegen.enums import GENERATOR_ACTUS_FN
+from actusmp.codegen.enums import LANG_UPSTREAM_REPO
+from actusmp.codegen.enums import WriteStatus
 from actusmp.dictionary import get_dictionary
+from actusmp.dictionary import save_dictionary
+from actusmp.dictionary.accessor import FILE
+from actusmp.model import Contract
+from actusmp.model import Dictionary
+from actusmp.model import FunctionSet
 from actusmp.utils import fsys
+from actusmp.utils import sinks
 
 
-def write(lang: TargetLanguage, dest: pathlib.Path, path_to_java_impl: pathlib.Path):
+@dataclasses.dataclass
+class WriteReport():
+    """Summary of the set of files touched by a write run.
+
+    """
+    # Files that did not previously exist.
+    created: typing.List[pathlib.Path] = dataclasses.field(default_factory=list)
+
+    # Files that existed with identical content and were left untouched.
+    unchanged: typing.List[pathlib.Path] = dataclasses.field(default_factory=list)
+
+    # Files that existed with different content and were overwritten.
+    updated: typing.List[pathlib.Path] = dataclasses.field(default_factory=list)
+
+    # Files emitted by a previous run but not by this one.
+    stale: typing.List[pathlib.Path] = dataclasses.field(default_factory=list)
+
+    # Stale files that were removed.
+    pruned: typing.List[pathlib.Path] = dataclasses.field(default_factory=list)
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"created={len(self.created)} | updated={len(self.updated)} | " \
+               f"unchanged={len(self.unchanged)} | stale={len(self.stale)} | pruned={len(self.pruned)}"
+
+
+def write(
+    lang: typing.Union[TargetLanguage, typing.Iterable[TargetLanguage]],
+    dest: pathlib.Path,
+    path_to_java_impl: pathlib.Path,
+    jobs: int = 1,
+    prune: bool = False,
+    options: typing.Optional[generator.GeneratorOptions] = None,
+    path_to_dictionary: pathlib.Path = FILE,
+    stream_dictionary: bool = False,
+    contracts: typing.Optional[typing.Iterable[str]] = None,
+    generators: typing.Optional[typing.Iterable[TargetGenerator]] = None,
+    sink: typing.Optional[sinks.Sink] = None,
+    cache_dictionary: bool = False
+):
     """Writes to file system a set of code blocks to initialise an upstream library.
 
-    :param lang: Target progamming language.
+    Stale files, i.e. those emitted by a previous run but not by this one, are
+    identified via a manifest written into each output directory.  When pruning, a stale
+    file is removed only if it has not been edited since it was emitted.
+
+    When several target languages are passed then code for each is emitted into a
+    sub-directory named after the upstream repo, e.g. dest/actus-core-py.  The
+    dictionary and the set of actus-core functions are parsed once and shared across
+    all target languages.
+
+    Generation may be restricted to a subset of contracts and/or generators, in which case
+    index files referencing the output of a selected generator are regenerated over the
+    full contract set, and files emitted by a previous run that fall outside of the
+    selection are retained within the manifest rather than being deemed stale.  The
+    manifest records the generator (and contract) from which each file was emitted so
+    as to determine whether it falls within a selection.
+
+    Output is written via a sink, by default directly to file system.  Alternative sinks
+    buffer output in memory, stream it into an archive or write it to file system in
+    bulk.  The sink is closed, i.e. flushed, once all output has been written.
+
+    :param lang: Target progamming language(s).
     :param dest: Path to directory to which code will be emitted.
     :param path_to_java_impl: Path to actus-code Java library from which funcs will be derived.
+    :param jobs: Number of worker processes over which rendering is distributed.
+    :param prune: Flag indicating whether stale files emitted by a previous run are to be removed.
+    :param options: Options controlling emitted code.
+    :param path_to_dictionary: Path to actus-dictionary.json file from which code will be derived.
+    :param stream_dictionary: Flag indicating whether dictionary is to be loaded section by section so as to bound peak memory.
+    :param contracts: Acronyms of contracts for which per contract code is emitted, e.g. ['PAM', 'ANN'] (all if None).
+    :param generators: Generators to be executed (all if None).
+    :param sink: Sink to which output is written (file system if None).
+    :param cache_dictionary: Flag indicating whether a cached snapshot of the dictionary is loaded & saved.
+    :returns: Summary of set of files touched.
 
     """
-    assert lang in TargetLanguage
+    langs = [lang] if isinstance(lang, TargetLanguage) else list(lang)
+    assert len(langs) > 0 and all(i in TargetLanguage for i in langs)
     assert dest.exists and dest.is_dir
     assert path_to_java_impl.exists() and path_to_java_impl.is_dir()
+    assert jobs >= 1
+    options = options or generator.GeneratorOptions()
+    if contracts is not None:
+        options = dataclasses.replace(options, contracts=frozenset(contracts))
+    if generators is not None:
+        options = dataclasses.replace(options, generators=frozenset(generators))
+    is_selective = len(options.contracts) > 0 or len(options.generators) > 0
+
+    with hooks.span("dictionary", "get_dictionary"):
+        dictionary = get_dictionary(path_to_dictionary, use_cache=cache_dictionary, stream=stream_dictionary)
+    unsupported = options.contracts - {i.acronym for i in dictionary.contract_set}
+    if unsupported:
+        raise ValueError(f"Unsupported contract type(s): {', '.join(sorted(unsupported))}")
+    with hooks.span("funcset", "get_funcset"):
+        funcset = fsys.get_funcset(path_to_java_impl)
+    targets = [(i, dest if len(langs) == 1 else dest / LANG_UPSTREAM_REPO[i]) for i in langs]
+
+    if jobs == 1:
+        code_blocks = _yield_code_blocks(targets, dictionary, funcset, path_to_java_impl, options)
+    else:
+        code_blocks = _yield_code_blocks_parallel(
+            targets, dictionary, funcset, path_to_java_impl, options, jobs
+            )
+
+    sink = sink or sinks.DirectorySink()
+    with sink:
+        selection = {dest: _get_selection(lang, options) for lang, dest in targets} if is_selective else None
+        report = _write_code_blocks(sink, code_blocks, [i for _, i in targets], prune, selection)
+
+    # Snapshot once rendered so that only components left untouched by rendering are loaded to do so.
+    if cache_dictionary:
+        with hooks.span("dictionary", "save_dictionary"):
+            save_dictionary(dictionary, path_to_dictionary)
+
+    return report
+
+
+def _write_code_blocks(
+    sink: sinks.Sink,
+    code_blocks: typing.Iterator[typing.Tuple[pathlib.Path, pathlib.Path, str, dict, str]],
+    dests: typing.List[pathlib.Path],
+    prune: bool,
+    selection: typing.Optional[typing.Dict[pathlib.Path, typing.Callable[[typing.Optional[str]], bool]]]
+) -> WriteReport:
+    """Writes set of code blocks to a sink together with a manifest per output directory.
+
+    """
+    report = WriteReport()
+    manifests = {dest: dict() for dest in dests}
+    sources = {dest: dict() for dest in dests}
+    for dest, code_dest, code_block, attrs, source in code_blocks:
+        with hooks.span("write", str(code_dest.relative_to(dest)), **attrs) as span_attrs:
+            status = sink.write(code_dest, code_block)
+            span_attrs["status"] = status.name
+            span_attrs["bytes"] = 0 if status == WriteStatus.unchanged else len(code_block.encode("utf-8"))
+        getattr(report, status.name).append(code_dest)
+        fname = code_dest.relative_to(dest).as_posix()
+        manifests[dest][fname] = fsys.get_hash(code_block)
+        sources[dest][fname] = source
+
+    for dest, manifest in manifests.items():
+        manifest_previous, sources_previous = sink.read_manifest(dest)
+        for fname in sorted(set(manifest_previous) - set(manifest)):
+            if selection is not None and not selection[dest](sources_previous.get(fname)):
+                # Retain as file falls outside of selection rather than being stale.
+                manifest[fname] = manifest_previous[fname]
+                sources[dest][fname] = sources_previous.get(fname)
+                continue
+            report.stale.append(dest / fname)
+            if prune and sink.prune(dest, fname, manifest_previous[fname]):
+                report.pruned.append(dest / fname)
+            else:
+                # Retain so that file continues to be reported as stale.
+                manifest[fname] = manifest_previous[fname]
+                sources[dest][fname] = sources_previous.get(fname)
+        sink.write_manifest(dest, manifest, sources[dest])
+
+    return report
+
+
+def _yield_code_blocks(
+    targets: typing.List[typing.Tuple[TargetLanguage, pathlib.Path]],
+    dictionary: Dictionary,
+    funcset: FunctionSet,
+    path_to_java_impl: pathlib.Path,
+    options: generator.GeneratorOptions
+):
+    """Yields set of code blocks rendered within current process.
+
+    """
+    symbols = convertor.SymbolTable()
+    for lang, dest in targets:
+        for typeof in generator.get_generators(lang, options):
+            ctx = generator.GeneratorContext(lang, typeof, dictionary, path_to_java_impl, funcset, options, symbols)
+            attrs = _get_span_attrs(ctx)
+            for entity in generator.get_entities(ctx):
+                code_dest = _get_path_to_code_dest(dest, ctx, entity)
+                with hooks.span("render", str(code_dest.relative_to(dest)), **attrs) as span_attrs:
+                    code_block = generator.render(ctx, entity)
+                    span_attrs["bytes"] = len(code_block.encode("utf-8"))
+                yield dest, code_dest, code_block, attrs, _get_source(ctx, entity)
+
+
+def _yield_code_blocks_parallel(
+    targets: typing.List[typing.Tuple[TargetLanguage, pathlib.Path]],
+    dictionary: Dictionary,
+    funcset: FunctionSet,
+    path_to_java_impl: pathlib.Path,
+    options: generator.GeneratorOptions,
+    jobs: int
+):
+    """Yields set of code blocks rendered across a pool of worker processes.
+
+    Each (language, generator, entity) triple is an independent unit of work.  Units are
+    rendered by workers whilst the results of completed units are yielded in submission
+    order, thus output is identical to that of a serial run.
+
+    """
+    units = []
+    for lang, dest in targets:
+        for typeof in generator.get_generators(lang, options):
+            ctx = generator.GeneratorContext(lang, typeof, dictionary, path_to_java_impl, funcset, options)
+            attrs = _get_span_attrs(ctx)
+            for idx, entity in enumerate(generator.get_entities(ctx)):
+                units.append((
+                    lang, typeof, idx, dest, _get_path_to_code_dest(dest, ctx, entity), attrs, _get_source(ctx, entity)
+                    ))
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(dictionary, funcset, path_to_java_impl, options)
+    ) as executor:
+        code_blocks = executor.map(
+            _render_unit,
+            [(lang, typeof, idx) for lang, typeof, idx, _, _, _, _ in units],
+            chunksize=max(1, len(units) // (jobs * 4))
+            )
+        for (_, _, _, dest, code_dest, attrs, source), (code_block, started, elapsed, pid) in zip(units, code_blocks):
+            if hooks.is_active():
+                name = str(code_dest.relative_to(dest))
+                span_attrs = dict(attrs, bytes=len(code_block.encode("utf-8")))
+                hooks.emit(hooks.Span("render", name, started, elapsed, pid, span_attrs))
+            yield dest, code_dest, code_block, attrs, source
 
-    dictionary = get_dictionary()
-    for typeof in TargetGenerator:
-        ctx = generator.GeneratorContext(lang, typeof, dictionary, path_to_java_impl)
-        for code_block, entity in generator.generate(ctx):
-            code_dest = _get_path_to_code_dest(dest, ctx, entity)
-            fsys.write(code_dest, code_block)
+
+# Worker process state: set of generator contexts & associated entities.
+_WORKER_STATE: dict = dict()
+
+
+def _init_worker(
+    dictionary: Dictionary,
+    funcset: FunctionSet,
+    path_to_java_impl: pathlib.Path,
+    options: generator.GeneratorOptions
+):
+    """Initialises a worker process.
+
+    """
+    _WORKER_STATE.clear()
+    symbols = convertor.SymbolTable()
+    for lang in TargetLanguage:
+        for typeof in TargetGenerator:
+            _WORKER_STATE[(lang, typeof)] = generator.GeneratorContext(
+                lang, typeof, dictionary, path_to_java_impl, funcset, options, symbols
+                ), None
+
+
+def _render_unit(
+    unit: typing.Tuple[TargetLanguage, TargetGenerator, int]
+) -> typing.Tuple[str, float, float, int]:
+    """Renders a unit of work within a worker process.
+
+    Returns the code block together with timing information so that the parent
+    process can emit it to any registered hooks.
+
+    """
+    lang, typeof, idx = unit
+    ctx, entities = _WORKER_STATE[(lang, typeof)]
+    if entities is None:
+        entities = generator.get_entities(ctx)
+        _WORKER_STATE[(lang, typeof)] = ctx, entities
+
+    started = time.perf_counter()
+    code_block = generator.render(ctx, entities[idx])
+
+    return code_block, started, time.perf_counter() - started, os.getpid()
+
+
+def _get_selection(
+    lang: TargetLanguage,
+    options: generator.GeneratorOptions
+) -> typing.Callable[[typing.Optional[str]], bool]:
+    """Returns predicate over manifest sources indicating whether a file falls within a selective run.
+
+    A file falls within the selection if it was emitted by an executed generator and, when
+    emitted per contract, for a selected contract.  Files of unknown source are deemed to
+    fall outside of it.
+
+    """
+    generators = {i.name for i in generator.get_generators(lang, options)}
+
+    def _is_selected(source: typing.Optional[str]) -> bool:
+        if source is None:
+            return False
+        typeof, _, acronym = source.partition(":")
+        if typeof not in generators:
+            return False
+        return not acronym or not options.contracts or acronym in options.contracts
+
+    return _is_selected
+
+
+def _get_source(ctx: generator.GeneratorContext, entity) -> str:
+    """Returns source of a code block as recorded in the manifest, e.g. 'Termset:PAM' | 'EnumIndex'.
+
+    """
+    if ctx.typeof in GENERATOR_ACTUS_FN:
+        return f"{ctx.typeof.name}:{entity[0].acronym}"
+    elif isinstance(entity, Contract):
+        return f"{ctx.typeof.name}:{entity.acronym}"
+
+    return ctx.typeof.name
+
+
+def _get_span_attrs(ctx: generator.GeneratorContext) -> dict:
+    """Returns contextual attributes attached to spans emitted for a generator.
+
+    """
+    return {
+        "lang": ctx.lang.name,
+        "generator": ctx.typeof.name,
+        "template": generator.get_template_name(ctx),
+    }
 
 
 def _get_path_to_code_dest(dest: pathlib.Path, ctx: generator.GeneratorContext, entity):
     """Returns file system location to which code block will be written.
 
     """
-    if ctx.typeof in (TargetGenerator.FuncStubPOF, TargetGenerator.FuncStubSTF):
+    if ctx.typeof in GENERATOR_ACTUS_FN:
         return _get_path_to_code_dest_2(dest, ctx, entity)
     else:
         return _get_path_to_code_dest_1(dest, ctx, entity)
@@ -50,17 +362,30 @@ def _get_path_to_code_dest_1(dest: pathlib.Path, ctx: generator.GeneratorContext
             return dest / "types" / "enums" / "__init__.py"
         elif ctx.typeof == TargetGenerator.FuncIndex:
             return dest / "algos" / "executor.py"
+        elif ctx.typeof == TargetGenerator.FuncBatchIndex:
+            return dest / "algos" / "batch_executor.py"
         elif ctx.typeof == TargetGenerator.FuncStubIndex:
             return dest / "algos" / f"{entity.type_info.acronym.lower()}" / "__init__.py"
         elif ctx.typeof == TargetGenerator.FuncStubDoExecuteStep:
             return dest / "algos" / f"{entity.type_info.acronym.lower()}" / "do_execute_step.py"
         elif ctx.typeof == TargetGenerator.FuncStubDoGetSchedule:
             return dest / "algos" / f"{entity.type_info.acronym.lower()}" / "do_get_schedule.py"
+        elif ctx.typeof == TargetGenerator.Portfolio:
+            fname = f"{convertor.to_underscore_case(entity.type_info.acronym.lower())}.py"
+            return dest / "types" / "portfolios" / fname
         elif ctx.typeof == TargetGenerator.StateSpace:
             return dest / "types" / "core" / "states.py"
+        elif ctx.typeof == TargetGenerator.StateSpaceArray:
+            return dest / "types" / "core" / "state_array.py"
         elif ctx.typeof == TargetGenerator.Termset:
             fname = f"{convertor.to_underscore_case(entity.type_info.acronym.lower())}.py"
             return dest / "types" / "terms" / fname
+        elif ctx.typeof == TargetGenerator.TermsetCodec:
+            fname = f"{convertor.to_underscore_case(entity.type_info.acronym.lower())}.py"
+            return dest / "types" / "codecs" / fname
+        elif ctx.typeof == TargetGenerator.PortfolioStore:
+            fname = f"{convertor.to_underscore_case(entity.type_info.acronym.lower())}.py"
+            return dest / "types" / "stores" / fname
         elif ctx.typeof == TargetGenerator.TermsetIndex:
             return dest / "types" / "terms" / "__init__.py"
 
@@ -80,9 +405,17 @@ def _get_path_to_code_dest_1(dest: pathlib.Path, ctx: generator.GeneratorContext
             return dest / "algos" / f"{entity.type_info.acronym.lower()}" / "do_get_schedule.rs"
         elif ctx.typeof == TargetGenerator.StateSpace:
             return dest / "types" / "core" / "states.rs"
+        elif ctx.typeof == TargetGenerator.StateSpaceArray:
+            return dest / "types" / "core" / "state_array.rs"
         elif ctx.typeof == TargetGenerator.Termset:
             fname = f"{convertor.to_underscore_case(entity.type_info.acronym.lower())}.rs"
             return dest / "types" / "terms" / fname
+        elif ctx.typeof == TargetGenerator.TermsetCodec:
+            fname = f"{convertor.to_underscore_case(entity.type_info.acronym.lower())}.rs"
+            return dest / "types" / "codecs" / fname
+        elif ctx.typeof == TargetGenerator.PortfolioStore:
+            fname = f"{convertor.to_underscore_case(entity.type_info.acronym.lower())}.rs"
+            return dest / "types" / "stores" / fname
         elif ctx.typeof == TargetGenerator.TermsetIndex:
             return dest / "types" / "terms" / "mod.rs"
 
@@ -101,9 +434,17 @@ def _get_path_to_code_dest_1(dest: pathlib.Path, ctx: generator.GeneratorContext
             return dest / "algos" / f"{entity.type_info.acronym.lower()}" / "doGetSchedule.ts"
         elif ctx.typeof == TargetGenerator.StateSpace:
             return dest / "types" / "core" / "states.ts"
+        elif ctx.typeof == TargetGenerator.StateSpaceArray:
+            return dest / "types" / "core" / "stateArray.ts"
         elif ctx.typeof == TargetGenerator.Termset:
             fname = f"{convertor.to_pascal_case(entity.type_info.acronym.lower())}.ts"
             return dest / "types" / "terms" / fname
+        elif ctx.typeof == TargetGenerator.TermsetCodec:
+            fname = f"{convertor.to_pascal_case(entity.type_info.acronym.lower())}.ts"
+            return dest / "types" / "codecs" / fname
+        elif ctx.typeof == TargetGenerator.PortfolioStore:
+            fname = f"{convertor.to_pascal_case(entity.type_info.acronym.lower())}.ts"
+            return dest / "types" / "stores" / fname
         elif ctx.typeof == TargetGenerator.TermsetIndex:
             return dest / "types" / "terms" / "index.ts"
 
@@ -116,6 +457,8 @@ def _get_path_to_code_dest_2(dest: pathlib.Path, ctx: generator.GeneratorContext
 
     fname = f"{f_type.name.lower()}_{event_type}"
     fname = f"{fname}_{suffix}" if suffix else f"{fname}"
+    if ctx.typeof in (TargetGenerator.FuncStubBatchPOF, TargetGenerator.FuncStubBatchSTF):
+        fname = f"batch_{fname}"
 
     if ctx.lang == TargetLanguage.python:
         outdir = dest / "algos" / f"{defn.type_info.acronym.lower()}"
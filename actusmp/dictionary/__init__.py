@@ -1 +1,2 @@
 from actusmp.dictionary.factory import get_dictionary
+from actusmp.dictionary.factory import save_dictionary
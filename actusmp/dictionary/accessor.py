@@ -8,16 +8,28 @@ from actusmp.dictionary.parser import parse
 
 
 # Path to actus-dictionary.json file.
-_FILE: pathlib.Path = pathlib.Path(os.path.dirname(__file__)) / "actus-dictionary.json"
+FILE: pathlib.Path = pathlib.Path(os.path.dirname(__file__)) / "actus-dictionary.json"
+
+# Number of characters initially read per chunk when streaming a dictionary file.
+_CHUNK_SIZE: int = 1 << 16
 
 
 class Accessor():
     """Encapsulates access to actus-dictionary.json.
 
     """
-    def __init__(self):
-        with open(_FILE, "r") as fstream:
-            self._obj: dict = parse(json.loads(fstream.read()))
+    def __init__(self, path: pathlib.Path = FILE, obj: typing.Optional[dict] = None):
+        """Instance constructor.
+
+        :param path: Path to an actus-dictionary.json file.
+        :param obj: A previously loaded (possibly partial) & parsed dictionary, if passed path is ignored.
+
+        """
+        if obj is not None:
+            self._obj: dict = obj
+        else:
+            with open(path, "r") as fstream:
+                self._obj: dict = parse(json.loads(fstream.read()))
 
     @property
     def applicability(self) -> typing.List[dict]:
@@ -66,3 +78,75 @@ class Accessor():
     @property
     def version_date(self) -> datetime.datetime:
         return datetime.datetime.fromisoformat(self._obj["version"]["Date"])
+
+
+def yield_sections(path: pathlib.Path = FILE) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+    """Yields each top level section of an actus-dictionary.json file, e.g. ('terms', {...}).
+
+    Sections are decoded one at a time so that only the raw text of the section being
+    decoded, rather than that of the whole file, is held in memory.
+
+    :param path: Path to an actus-dictionary.json file.
+    :returns: Iterator over (section name, decoded section) pairs.
+
+    """
+    with open(path, "r") as fstream:
+        reader = _SectionReader(fstream)
+        reader.consume("{")
+        while reader.peek() != "}":
+            name = reader.decode()
+            reader.consume(":")
+            yield name, reader.decode()
+            if reader.peek() == ",":
+                reader.consume(",")
+
+
+class _SectionReader():
+    """Incrementally decodes JSON values from a text stream.
+
+    """
+    def __init__(self, fstream: typing.TextIO):
+        """Instance constructor.
+
+        """
+        self._decoder = json.JSONDecoder()
+        self._fstream = fstream
+        self._buffer = ""
+        self._idx = 0
+
+    def consume(self, token: str):
+        """Advances past an expected structural token."""
+        if self.peek() != token:
+            raise ValueError(f"Invalid dictionary file: expected '{token}' at {self._buffer[self._idx:self._idx + 32]!r}")
+        self._idx += 1
+
+    def decode(self) -> typing.Any:
+        """Decodes next value, reading further chunks until the value is complete."""
+        self.peek()
+        while True:
+            try:
+                value, self._idx = self._decoder.raw_decode(self._buffer, self._idx)
+            except json.JSONDecodeError:
+                # Grow chunk size with buffer so that re-decoding a large value is amortised.
+                if not self._read(max(_CHUNK_SIZE, len(self._buffer) - self._idx)):
+                    raise
+            else:
+                return value
+
+    def peek(self) -> str:
+        """Returns next non-whitespace character."""
+        while True:
+            while self._idx < len(self._buffer) and self._buffer[self._idx].isspace():
+                self._idx += 1
+            if self._idx < len(self._buffer):
+                return self._buffer[self._idx]
+            if not self._read(_CHUNK_SIZE):
+                raise ValueError("Invalid dictionary file: unexpected end of file")
+
+    def _read(self, size: int) -> bool:
+        """Appends a chunk to buffer, discarding consumed text."""
+        chunk = self._fstream.read(size)
+        self._buffer = self._buffer[self._idx:] + chunk
+        self._idx = 0
+
+        return len(chunk) > 0
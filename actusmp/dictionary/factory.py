@@ -1,6 +1,11 @@
+import pathlib
 import typing
 
+from actusmp.dictionary import snapshot
 from actusmp.dictionary.accessor import Accessor
+from actusmp.dictionary.accessor import FILE
+from actusmp.dictionary.accessor import yield_sections
+from actusmp.dictionary.parser import parse_section
 from actusmp.model import ApplicableTermInfoSet
 from actusmp.model import ApplicableTermInfo
 from actusmp.model import Contract
@@ -18,31 +23,104 @@ from actusmp.model import Term
 from actusmp.model import TermSet
 
 
-def get_dictionary() -> Dictionary:
+def get_dictionary(path: pathlib.Path = FILE, use_cache: bool = False, stream: bool = False) -> Dictionary:
     """Maps actus-dictionary.json file -> meta model.
 
+    Snapshots are opt-in: loading one costs about as much as building a dictionary lazily
+    and touching all of it, hence the saving is marginal (see jobs/benchmark.py).  A
+    dictionary built upon a cache miss is not snapshotted here as doing so would load
+    every component, thus defeating lazy loading.  Callers instead snapshot it via
+    save_dictionary once it has been used.
+
+    :param path: Path to an actus-dictionary.json file.
+    :param use_cache: Flag indicating whether a cached snapshot of the model may be used.
+    :param stream: Flag indicating whether file is to be decoded & mapped section by section so as to bound peak memory.
+    :returns: Dictionary meta model.
+
+    """
+    build = _get_dictionary_streamed if stream else _get_dictionary
+    if not use_cache:
+        return build(path)
+
+    dictionary = snapshot.load(snapshot.get_key(path))
+    if dictionary is None:
+        dictionary = build(path)
+
+    return dictionary
+
+
+def save_dictionary(dictionary: Dictionary, path: pathlib.Path = FILE):
+    """Caches a snapshot of a dictionary unless one has already been cached.
+
+    Pending components are loaded prior to snapshotting, hence a dictionary is best saved
+    once it has been used, i.e. when few of its components remain pending.
+
+    :param dictionary: Dictionary meta model.
+    :param path: Path to actus-dictionary.json file from which dictionary was mapped.
+
+    """
+    key = snapshot.get_key(path)
+    if not snapshot.exists(key):
+        snapshot.save(key, dictionary)
+
+
+def _get_dictionary(path: pathlib.Path) -> Dictionary:
+    """Maps actus-dictionary.json file -> meta model.
+
+    Each component is mapped upon first access, i.e. a run pays only for the components it touches.
+
     """
-    accessor = Accessor()
-    applicability = _get_applicability(accessor)
-    taxonomy = _get_taxonomy(accessor)
-    term_set = _get_term_set(accessor)
-
-    return Dictionary(
-        applicability=applicability,
-        contract_event_type=_get_enum(accessor.contract_event_type),
-        contract_performance=_get_enum(accessor.contract_performance),
-        contract_role=_get_enum(accessor.contract_role),
-        contract_reference_role=_get_enum(accessor.contract_reference_role),
-        contract_reference_type=_get_enum(accessor.contract_reference_type),
-        contract_type=_get_enum(accessor.contract_type),
-        contract_set=_get_contract_set(applicability, taxonomy, term_set),
-        state_set=_get_state_set(accessor),
-        taxonomy=taxonomy,
-        term_set=term_set,
+    accessor = Accessor(path)
+    dictionary = Dictionary(
+        applicability=lambda: _get_applicability(accessor),
+        contract_event_type=lambda: _get_enum(accessor.contract_event_type),
+        contract_performance=lambda: _get_enum(accessor.contract_performance),
+        contract_role=lambda: _get_enum(accessor.contract_role),
+        contract_reference_role=lambda: _get_enum(accessor.contract_reference_role),
+        contract_reference_type=lambda: _get_enum(accessor.contract_reference_type),
+        contract_type=lambda: _get_enum(accessor.contract_type),
+        contract_set=lambda: _get_contract_set(dictionary),
+        state_set=lambda: _get_state_set(accessor),
+        taxonomy=lambda: _get_taxonomy(accessor),
+        term_set=lambda: _get_term_set(accessor),
         version=accessor.version,
         version_date=accessor.version_date
         )
 
+    return dictionary
+
+
+def _get_dictionary_streamed(path: pathlib.Path) -> Dictionary:
+    """Maps actus-dictionary.json file -> meta model, streaming the file section by section.
+
+    Each stage maps its sections as soon as they have been decoded, after which the raw
+    sections are dropped.  Sections not consumed by any stage are never retained.
+
+    """
+    obj = dict()
+    fields = dict()
+    accessor = Accessor(obj=obj)
+    stages = list(_STREAM_STAGES)
+    required = {i for sections, _ in stages for i in sections}
+    for name, section in yield_sections(path):
+        if name not in required:
+            continue
+        obj[name] = section
+        parse_section(obj, name)
+        for stage in [i for i in stages if all(j in obj for j in i[0])]:
+            sections, mapper = stage
+            fields.update(mapper(accessor))
+            for i in sections:
+                del obj[i]
+            stages.remove(stage)
+
+    if stages:
+        raise ValueError(f"Invalid dictionary file: missing sections {sorted(i for j, _ in stages for i in j)}")
+
+    dictionary = Dictionary(contract_set=lambda: _get_contract_set(dictionary), **fields)
+
+    return dictionary
+
 
 def _get_applicability(accessor: Accessor) -> ApplicableTermInfoSet:
     """Decodes applicability declarations.
@@ -64,29 +142,27 @@ def _get_applicability(accessor: Accessor) -> ApplicableTermInfoSet:
     return ApplicableTermInfoSet(items)
 
 
-def _get_contract_set(
-    applicability: ApplicableTermInfoSet,
-    taxonomy: Taxonomy,
-    term_set: TermSet
-) -> ContractSet:
+def _get_contract_set(dictionary: Dictionary) -> ContractSet:
     """Decodes set of derived contract declarations.
 
+    The term set of each contract is mapped upon first access.
+
     """
     def _map_termset(type_info: ContractTypeInfo) -> TermSet:
         contract_termset = []
-        for applicable_term_info in applicability.get_applicable_termset(type_info):
-            contract_termset.append(term_set.get_term(applicable_term_info.term_id))
+        for applicable_term_info in dictionary.applicability.get_applicable_termset(type_info):
+            contract_termset.append(dictionary.term_set.get_term(applicable_term_info.term_id))
 
         return TermSet(contract_termset)
 
     def _map_contract(type_info: ContractTypeInfo) -> Contract:
         return Contract(
-            term_set=_map_termset(type_info),
+            term_set=lambda: _map_termset(type_info),
             type_info=type_info,
         )
 
     return ContractSet(
-        [i for i in map(lambda i: _map_contract(i), taxonomy) if i.type_info.acronym != "EXOTi"]
+        [_map_contract(i) for i in dictionary.taxonomy if i.acronym != "EXOTi"]
         )
 
 
@@ -114,6 +190,7 @@ def _get_enum_member(obj: dict, is_default: typing.Optional[bool] = None) -> Enu
         is_default=is_default,
         name=obj["name"],
         option=int(obj["option"]),
+        aliases=obj.get("aliases", []),
     )
 
 
@@ -199,7 +276,8 @@ def _get_term_set(accessor: Accessor) -> TermSet:
                 identifier=value["identifier"],
                 is_default=value["acronym"] == default,
                 name=value["name"],
-                option=value["option"]
+                option=value["option"],
+                aliases=value.get("aliases", [])
             )
         else:
             return value
@@ -224,3 +302,32 @@ def _get_term_set(accessor: Accessor) -> TermSet:
         )
 
     return TermSet([_map_term(i) for i in accessor.term_set])
+
+
+# Set of (sections, mapper) stages executed by streaming loader, each section being consumed by a single stage.
+_STREAM_STAGES: typing.Tuple[typing.Tuple[typing.Tuple[str, ...], typing.Callable[[Accessor], dict]], ...] = (
+    (("version", ), lambda i: {
+        "version": i.version,
+        "version_date": i.version_date,
+    }),
+    (("taxonomy", "terms"), lambda i: {
+        "contract_performance": _get_enum(i.contract_performance),
+        "contract_role": _get_enum(i.contract_role),
+        "contract_type": _get_enum(i.contract_type),
+        "taxonomy": _get_taxonomy(i),
+        "term_set": _get_term_set(i),
+    }),
+    (("applicability", ), lambda i: {
+        "applicability": _get_applicability(i),
+    }),
+    (("states", ), lambda i: {
+        "state_set": _get_state_set(i),
+    }),
+    (("event", ), lambda i: {
+        "contract_event_type": _get_enum(i.contract_event_type),
+    }),
+    (("contractReference", ), lambda i: {
+        "contract_reference_role": _get_enum(i.contract_reference_role),
+        "contract_reference_type": _get_enum(i.contract_reference_type),
+    }),
+)
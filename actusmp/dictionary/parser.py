@@ -1,12 +1,28 @@
+import typing
+
 
 def parse(obj: dict):
     """Parses ACTUS dictionary so as to simplify upstream processing consistency.
 
     """
-    _parse_contract_reference_enums(obj)
-    _parse_contract_types(obj)
-    _parse_term_default(obj)
-    _parse_term_scaling_effect(obj)
+    for step, _ in _STEPS:
+        step(obj)
+
+    return obj
+
+
+def parse_section(obj: dict, name: str):
+    """Parses a partially loaded ACTUS dictionary upon arrival of a section.
+
+    Each parse step executes once, i.e. upon arrival of the last of the sections over which it executes.
+
+    :param obj: Partially loaded dictionary.
+    :param name: Name of section that has just been loaded, e.g. 'terms'.
+
+    """
+    for step, sections in _STEPS:
+        if name in sections and all(i in obj for i in sections):
+            step(obj)
 
     return obj
 
@@ -80,6 +96,16 @@ def _parse_term_scaling_effect(obj: dict):
         "IN0": "INO",
     }
     for val in term["allowedValues"]:
+        val["aliases"] = [val["acronym"]]
         val["acronym"] = _ACRONYMS[val["acronym"]]
 
     obj["terms"]["scalingEffect"] = term
+
+
+# Set of (parse step, sections over which step executes) pairs.
+_STEPS: typing.Tuple[typing.Tuple[typing.Callable[[dict], None], typing.Tuple[str, ...]], ...] = (
+    (_parse_contract_reference_enums, ("contractReference", )),
+    (_parse_contract_types, ("taxonomy", "terms")),
+    (_parse_term_default, ("terms", )),
+    (_parse_term_scaling_effect, ("terms", )),
+)
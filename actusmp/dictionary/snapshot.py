@@ -0,0 +1,129 @@
+import hashlib
+import os
+import pathlib
+import pickle
+import typing
+
+import actusmp
+from actusmp.model import Dictionary
+from actusmp.utils import fsys
+
+
+# Name of cache sub-folder into which snapshots are written.
+_CACHE_NAME: str = "dictionary"
+
+# Number of snapshots retained, i.e. those of the most recently used dictionaries.
+_CAPACITY: int = 8
+
+# Set of source folders whose content determines the shape of a snapshot.
+_SOURCES: typing.Tuple[pathlib.Path] = (
+    pathlib.Path(os.path.dirname(__file__)),
+    pathlib.Path(os.path.dirname(__file__)).parent / "model",
+)
+
+
+def discard(key: str):
+    """Removes a previously cached dictionary snapshot.
+
+    :param key: Snapshot cache key.
+
+    """
+    try:
+        _get_path_to_snapshot(key).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def exists(key: str) -> bool:
+    """Returns flag indicating whether a dictionary snapshot has been cached.
+
+    :param key: Snapshot cache key.
+
+    """
+    try:
+        return _get_path_to_snapshot(key).exists()
+    except OSError:
+        return False
+
+
+def get_key(path_to_dictionary: pathlib.Path) -> str:
+    """Returns key under which a dictionary snapshot is cached.
+
+    The key is derived from the dictionary file content, the package version and the
+    source code of the parser, factory & model so that a change in any of them
+    invalidates previously cached snapshots.
+
+    :param path_to_dictionary: Path to an actus-dictionary.json file.
+    :returns: A hex digest.
+
+    """
+    h = hashlib.sha256()
+    h.update(actusmp.__version__.encode())
+    h.update(path_to_dictionary.read_bytes())
+    for folder in _SOURCES:
+        for fpath in sorted(folder.glob("*.py")):
+            h.update(fpath.read_bytes())
+
+    return h.hexdigest()
+
+
+def load(key: str) -> typing.Optional[Dictionary]:
+    """Returns a previously cached dictionary snapshot.
+
+    :param key: Snapshot cache key.
+    :returns: A dictionary if a valid snapshot was found, otherwise None.
+
+    """
+    try:
+        fpath = _get_path_to_snapshot(key)
+        with open(fpath, "rb") as fstream:
+            dictionary = pickle.load(fstream)
+        # Mark as recently used so that it is retained when pruning.
+        os.utime(fpath)
+    except Exception:
+        return None
+
+    return dictionary if isinstance(dictionary, Dictionary) else None
+
+
+def save(key: str, dictionary: Dictionary):
+    """Caches a dictionary snapshot, pruning least recently used snapshots.
+
+    Snapshots of several dictionaries, e.g. the bundled one & a forked one, are retained
+    so that alternating between them does not invalidate each other's snapshot.  Caching is best effort, i.e. an unwritable cache folder is silently ignored.
+
+    :param key: Snapshot cache key.
+    :param dictionary: Dictionary to be cached.
+
+    """
+    try:
+        fpath = _get_path_to_snapshot(key)
+        _prune(fpath.parent, _CAPACITY - 1)
+
+        # Write to a temporary file first so that concurrent readers never see a partial snapshot.
+        fpath_tmp = fpath.with_suffix(f".{os.getpid()}.tmp")
+        with open(fpath_tmp, "wb") as fstream:
+            pickle.dump(dictionary, fstream, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(fpath_tmp, fpath)
+    except OSError:
+        pass
+
+
+def _get_path_to_snapshot(key: str) -> pathlib.Path:
+    """Returns path to a cached snapshot.
+
+    """
+    return fsys.get_path_to_cache(_CACHE_NAME) / f"{key}.pickle"
+
+
+def _prune(folder: pathlib.Path, capacity: int):
+    """Removes least recently used snapshots such that at most capacity snapshots remain.
+
+    """
+    try:
+        snapshots = sorted(folder.glob("*.pickle"), key=lambda i: i.stat().st_mtime, reverse=True)
+        for stale in snapshots[capacity:]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        # A concurrent writer may have pruned the same snapshots.
+        pass
@@ -7,7 +7,10 @@ from actusmp.model.entity import Entity
 from actusmp.model.entity import IterableEntity
 from actusmp.model.enum_ import Enum
 from actusmp.model.enum_ import EnumMember
+from actusmp.model.funcs import Function
+from actusmp.model.funcs import FunctionSet
 from actusmp.model.funcs import FunctionType
+from actusmp.model.lazy import LazyEntity
 from actusmp.model.scalar_type import ScalarType
 from actusmp.model.state import State
 from actusmp.model.state import StateSet
@@ -36,9 +36,16 @@ class ApplicableTermInfoSet():
     # Collection of associated applicable contract terms.
     _items: typing.List[ApplicableTermInfo]
 
+    def __post_init__(self):
+        """Instance initialiser: caches sorted view & contract type index."""
+        self._sorted: typing.List[ApplicableTermInfo] = sorted(self._items, key=lambda i: i.sort_key)
+        self._index: typing.Dict[str, typing.List[ApplicableTermInfo]] = dict()
+        for item in self._sorted:
+            self._index.setdefault(item.contract_type_id, []).append(item)
+
     def __iter__(self) -> typing.Iterator[ApplicableTermInfo]:
         """Instance iterator."""
-        return iter(sorted(self._items, key=lambda i: i.sort_key))
+        return iter(self._sorted)
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -55,6 +62,5 @@ class ApplicableTermInfoSet():
         :returns: Sequence of applicable terms.
 
         """
-        for info in self:
-            if info.contract_type_id == type_info.identifier:
-                yield info
+        for info in self._index.get(type_info.identifier, []):
+            yield info
@@ -1,18 +1,19 @@
 import dataclasses
 import typing
 
+from actusmp.model.lazy import LazyEntity
 from actusmp.model.scalar_type import ScalarType
 from actusmp.model.taxonomy import ContractTypeInfo
 from actusmp.model.term import TermSet
 
 
 @dataclasses.dataclass
-class Contract():
+class Contract(LazyEntity):
     """A node within the ACTUS taxonomy representing a financial contract associated with
        an algorithm for deriving cash flow exposure amoungst a set of counter-parties.
 
     """
-    # Set of applicable terms.
+    # Set of applicable terms (or a loader thereof).
     term_set: TermSet
 
     # Associated type information such as acronym, identifier ...etc.
@@ -57,9 +58,18 @@ class ContractSet():
     # Collection of associated contracts.
     _items: typing.List[Contract]
 
+    def __post_init__(self):
+        """Instance initialiser: caches sorted view & identifier/acronym indexes."""
+        self._sorted: typing.List[Contract] = sorted(self._items, key=lambda i: i.type_info.acronym)
+        self._index_by_acronym: typing.Dict[str, Contract] = dict()
+        self._index_by_identifier: typing.Dict[str, Contract] = dict()
+        for item in self._sorted:
+            self._index_by_acronym.setdefault(item.acronym, item)
+            self._index_by_identifier.setdefault(item.identifier, item)
+
     def __iter__(self) -> typing.Iterator[Contract]:
         """Instance iterator."""
-        return iter(sorted(self._items, key=lambda i: i.type_info.acronym))
+        return iter(self._sorted)
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -76,6 +86,13 @@ class ContractSet():
         :returns: A contract matched by it's id.
 
         """
-        for item in self:
-            if item.identifier == contract_id:
-                return item
+        return self._index_by_identifier.get(contract_id)
+
+    def get_contract_by_acronym(self, acronym: str) -> typing.Optional[Contract]:
+        """Returns first contract within associated collection with matching acronym.
+
+        :param acronym: Acronym of a contract, e.g. 'PAM'.
+        :returns: A contract matched by it's acronym.
+
+        """
+        return self._index_by_acronym.get(acronym)
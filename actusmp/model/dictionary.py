@@ -5,15 +5,18 @@ import typing
 from actusmp.model.applicability import ApplicableTermInfoSet
 from actusmp.model.contract import ContractSet
 from actusmp.model.enum_ import Enum
+from actusmp.model.lazy import LazyEntity
 from actusmp.model.state import StateSet
 from actusmp.model.taxonomy import Taxonomy
 from actusmp.model.term import TermSet
 
 
 @dataclasses.dataclass
-class Dictionary():
+class Dictionary(LazyEntity):
     """An information set by which the ACTUS standard is declared.
 
+    Each component may be declared as a loader so that it is only built when first accessed.
+
     """
     # Criteria that determine which set of terms are associated with which type of contract.
     applicability: ApplicableTermInfoSet
@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import typing
 
 
@@ -29,7 +30,12 @@ class Entity():
 
     def is_match(self, identifier: str):
         """Predicate: returns true if identifier can be matched."""
-        return identifier.upper() in [self.acronym.upper(), self.identifier.upper()]
+        return identifier.upper() in self._match_keys
+
+    @functools.cached_property
+    def _match_keys(self) -> typing.FrozenSet[str]:
+        """Set of upper cased keys against which an identifier is matched."""
+        return frozenset((self.acronym.upper(), self.identifier.upper()))
 
 
 @dataclasses.dataclass
@@ -40,9 +46,16 @@ class IterableEntity():
     # Collection of associated contract terms.
     _terms: typing.List[Entity]
 
+    def __post_init__(self):
+        """Instance initialiser: caches sorted view & identifier index."""
+        self._sorted: typing.List[Entity] = sorted(self._terms, key=lambda i: i.identifier)
+        self._index: typing.Dict[str, Entity] = dict()
+        for item in self._sorted:
+            self._index.setdefault(item.identifier, item)
+
     def __iter__(self) -> typing.Iterator[Entity]:
         """Instance iterator."""
-        return iter(sorted(self._terms, key=lambda i: i.identifier))
+        return iter(self._sorted)
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -54,6 +67,4 @@ class IterableEntity():
 
     def get_item(self, identifier: str) -> Entity:
         """Returns first item matched by identifier."""
-        for item in self:
-            if item.identifier == identifier:
-                return item
+        return self._index.get(identifier)
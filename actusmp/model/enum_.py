@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import typing
 
 from actusmp.model.entity import Entity
@@ -15,6 +16,14 @@ class EnumMember(Entity):
     # Ordinal position within enumeration scope.
     option: int
 
+    # Alternative acronyms by which member may be matched, e.g. '0N0'.
+    aliases: typing.List[str] = dataclasses.field(default_factory=list)
+
+    @functools.cached_property
+    def _match_keys(self) -> typing.FrozenSet[str]:
+        """Set of upper cased keys against which an identifier is matched."""
+        return frozenset([self.acronym.upper(), self.identifier.upper()] + [i.upper() for i in self.aliases])
+
 
 @dataclasses.dataclass
 class Enum(Entity):
@@ -24,13 +33,17 @@ class Enum(Entity):
     # Collection of associated enumeration members.
     members: typing.List[EnumMember]
 
+    def __post_init__(self):
+        """Instance initialiser: caches sorted view."""
+        self._sorted: typing.List[EnumMember] = sorted(self.members, key=lambda i: i.option)
+
     def __hash__(self) -> int:
         """Instance hash representation."""
         return hash(f"enum|{self.acronym}|{self.identifier}")
 
     def __iter__(self) -> typing.Iterator[EnumMember]:
         """Instance iterator."""
-        return iter(sorted(self.members, key=lambda i: i.option))
+        return iter(self._sorted)
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -1,4 +1,6 @@
+import dataclasses
 import enum
+import typing
 
 
 class FunctionType(enum.Enum):
@@ -10,3 +12,68 @@ class FunctionType(enum.Enum):
 
     # State transition function.
     STF = enum.auto()
+
+
+@dataclasses.dataclass
+class Function():
+    """A contract specific function declared within the actus-core reference implementation.
+
+    """
+    # Acronym of associated contract type, e.g. 'PAM'.
+    contract_acronym: str
+
+    # Type of event to which function is applied, e.g. 'IED'.
+    event_type: str
+
+    # Type of function, e.g. POF.
+    func_type: FunctionType
+
+    # Numeric suffix distinguishing variants of a function, e.g. '2'.
+    suffix: str
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"function|{self.func_type.name}|{self.event_type}|{self.contract_acronym}|{self.suffix}"
+
+    @property
+    def sort_key(self) -> str:
+        """A key used in sorting scenarios."""
+        return f"{self.contract_acronym.lower()}|{self.func_type.name}|{self.event_type}|{self.suffix}"
+
+
+@dataclasses.dataclass
+class FunctionSet():
+    """Set of contract specific functions declared within the actus-core reference implementation.
+
+    """
+    # Collection of associated functions.
+    _items: typing.List[Function]
+
+    def __post_init__(self):
+        """Instance initialiser: caches sorted view & (contract, function type) index."""
+        self._sorted: typing.List[Function] = sorted(self._items, key=lambda i: i.sort_key)
+        self._index: typing.Dict[typing.Tuple[str, FunctionType], typing.List[Function]] = dict()
+        for item in self._sorted:
+            self._index.setdefault((item.contract_acronym.lower(), item.func_type), []).append(item)
+
+    def __iter__(self) -> typing.Iterator[Function]:
+        """Instance iterator."""
+        return iter(self._sorted)
+
+    def __len__(self) -> int:
+        """Instance iterator length."""
+        return len(self._items)
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"function-set|{len(self)}"
+
+    def get_functions(self, contract_acronym: str, func_type: FunctionType) -> typing.List[Function]:
+        """Returns set of functions filtered by contract type & function type.
+
+        :param contract_acronym: Acronym of a contract type, e.g. 'PAM'.
+        :param func_type: Type of function, e.g. POF.
+        :returns: Sequence of functions.
+
+        """
+        return self._index.get((contract_acronym.lower(), func_type), [])
@@ -0,0 +1,47 @@
+import dataclasses
+import typing
+
+
+@dataclasses.dataclass
+class LazyEntity():
+    """An entity whose fields may be declared as zero-argument loaders, each of which is
+       invoked once, i.e. upon first access of the field.
+
+    """
+    def __post_init__(self):
+        """Instance initialiser: defers loading of fields declared as loaders."""
+        self._loaders: typing.Dict[str, typing.Callable[[], typing.Any]] = dict()
+        for field in dataclasses.fields(self):
+            if callable(self.__dict__[field.name]):
+                self._loaders[field.name] = self.__dict__.pop(field.name)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        """Instance attribute accessor: invoked only when an attribute is not set, i.e. a field is pending."""
+        loaders = self.__dict__.get("_loaders")
+        if not loaders or name not in loaders:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        value = loaders.pop(name)()
+        setattr(self, name, value)
+
+        return value
+
+    def __getstate__(self) -> dict:
+        """Instance pickle state: loaders are not serialisable, hence pending fields are loaded."""
+        self.materialise()
+        return self.__dict__
+
+    @property
+    def is_materialised(self) -> bool:
+        """Returns flag indicating whether all fields have been loaded."""
+        return len(self._loaders) == 0
+
+    def materialise(self) -> "LazyEntity":
+        """Loads all pending fields.
+
+        :returns: Self.
+
+        """
+        for name in list(self._loaders):
+            getattr(self, name)
+
+        return self
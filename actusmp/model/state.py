@@ -38,9 +38,13 @@ class StateSet():
     # Collection of associated contract states.
     _states: typing.List[State]
 
+    def __post_init__(self):
+        """Instance initialiser: caches sorted view."""
+        self._sorted: typing.List[State] = sorted(self._states, key=lambda i: i.identifier)
+
     def __iter__(self) -> typing.Iterator[State]:
         """Instance iterator."""
-        return iter(sorted(self._states, key=lambda i: i.identifier))
+        return iter(self._sorted)
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -49,3 +53,12 @@ class StateSet():
     def __str__(self) -> str:
         """Instance string representation."""
         return f"state-set|{len(self)}"
+
+    def get_states(self, scalar_type: ScalarType) -> typing.List[State]:
+        """Returns set of scalar states of a certain type, the position of each being its stable slot index.
+
+        :param scalar_type: Scalar type of state, e.g. Real.
+        :returns: Sequence of states ordered by identifier.
+
+        """
+        return [i for i in self._sorted if i.scalar_type == scalar_type and not i.is_array]
@@ -50,9 +50,13 @@ class Taxonomy():
     # Collection of associated applicable contract terms.
     _items: typing.List[ContractTypeInfo]
 
+    def __post_init__(self):
+        """Instance initialiser: caches sorted view."""
+        self._sorted: typing.List[ContractTypeInfo] = sorted(self._items, key=lambda i: i.acronym)
+
     def __iter__(self) -> typing.Iterator[ContractTypeInfo]:
         """Instance iterator."""
-        return iter(sorted(self._items, key=lambda i: i.acronym))
+        return iter(self._sorted)
 
     def __len__(self) -> int:
         """Instance iterator length."""
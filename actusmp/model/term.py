@@ -51,9 +51,16 @@ class TermSet():
     # Collection of associated contract terms.
     _terms: typing.List[Term]
 
+    def __post_init__(self):
+        """Instance initialiser: caches sorted view & identifier index."""
+        self._sorted: typing.List[Term] = sorted(self._terms, key=lambda i: i.identifier)
+        self._index: typing.Dict[str, Term] = dict()
+        for item in self._sorted:
+            self._index.setdefault(item.identifier, item)
+
     def __iter__(self) -> typing.Iterator[Term]:
         """Instance iterator."""
-        return iter(sorted(self._terms, key=lambda i: i.identifier))
+        return iter(self._sorted)
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -65,9 +72,7 @@ class TermSet():
 
     def get_term(self, identifier: str) -> Term:
         """Returns first term matched by identifier."""
-        for item in self:
-            if item.identifier == identifier:
-                return item
+        return self._index.get(identifier)
 
     def get_by_group_id(self, group_id: str) -> "TermSet":
         """Returns set of terms matched by group identifier."""
@@ -1,5 +1,7 @@
+import hashlib
 import os
 import pathlib
+import pickle
 import typing
 
 import jinja2
@@ -7,14 +9,85 @@ import jinja2
 from actusmp import model
 from actusmp.codegen.enums import TargetLanguage
 from actusmp.codegen.enums import LANG_TEMPLATE_SUBFOLDER
+from actusmp.codegen.enums import WriteStatus
 
 # Set templates home folder.
 _TEMPLATES_DIR: pathlib.Path = pathlib.Path(os.path.dirname(__file__)).parent / "templates"
 
+# Set default cache home folder - overridable via ACTUSMP_CACHE_DIR environment variable.
+_CACHE_DIR: pathlib.Path = pathlib.Path.home() / ".cache" / "actusmp"
+
 # Map: TargetLanguage <-> jinja2.Environment
 _CODEGEN_ENVS: typing.Dict[TargetLanguage, jinja2.Environment] = dict()
 
 
+def get_funcset(path_to_java_funcs: pathlib.Path, use_cache: bool = True) -> model.FunctionSet:
+    """Returns set of functions declared in actus-core for which code can be emitted.
+
+    In actus-core.functions there is a sub-package for each supported contract type.
+    Within each sub-package is the set of contract specific functions.  Each such
+    function is named: {func-type}_{event-type}_{contract-type}.java.  The tree is
+    walked in a single pass, the result being cached until a sub-package's mtime changes.
+
+    :param path_to_java_funcs: Path to functions defined in actus-core.
+    :param use_cache: Flag indicating whether a previously cached scan may be used.
+    :returns: Set of functions declared in actus-core.
+
+    """
+    with os.scandir(path_to_java_funcs) as iterator:
+        folders = sorted((i.name, i.stat().st_mtime_ns) for i in iterator if i.is_dir())
+    if not use_cache:
+        return _scan_funcset(path_to_java_funcs, folders)
+
+    key = hashlib.sha256(str(path_to_java_funcs.resolve()).encode("utf-8")).hexdigest()
+    try:
+        fpath = get_path_to_cache("funcs") / f"{key}.pickle"
+        with open(fpath, "rb") as fstream:
+            signature, funcset = pickle.load(fstream)
+        if signature == folders:
+            return funcset
+    except Exception:
+        pass
+
+    funcset = _scan_funcset(path_to_java_funcs, folders)
+    try:
+        fpath = get_path_to_cache("funcs") / f"{key}.pickle"
+        fpath_tmp = fpath.with_suffix(f".{os.getpid()}.tmp")
+        with open(fpath_tmp, "wb") as fstream:
+            pickle.dump((folders, funcset), fstream, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(fpath_tmp, fpath)
+    except Exception:
+        pass
+
+    return funcset
+
+
+def get_hash(content: str) -> str:
+    """Returns hash of a code block's content.
+
+    :param content: File content.
+    :returns: A hex digest.
+
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def get_path_to_cache(name: str) -> pathlib.Path:
+    """Returns path to a named sub-folder within the local cache, creating it if necessary.
+
+    The ACTUSMP_CACHE_DIR environment variable is read upon each call so that it may be
+    overridden for the duration of a run, e.g. by the benchmark.
+
+    :param name: Name of cache sub-folder, e.g. 'dictionary'.
+    :returns: Path to cache sub-folder.
+
+    """
+    path = pathlib.Path(os.getenv("ACTUSMP_CACHE_DIR", _CACHE_DIR)) / name
+    path.mkdir(parents=True, exist_ok=True)
+
+    return path
+
+
 def get_template(lang: TargetLanguage, fname: str):
     """Returns a template for rendering.
 
@@ -29,20 +102,61 @@ def get_template(lang: TargetLanguage, fname: str):
     return _CODEGEN_ENVS[lang].get_template(fname)
 
 
-def write(fpath: pathlib.Path, content: str):
+def read(fpath: pathlib.Path) -> typing.Optional[str]:
+    """Returns contents of a file previously written to file system.
+
+    :param fpath: Target file path.
+    :returns: File content if file exists, otherwise None.
+
+    """
+    try:
+        with open(fpath, "r") as fstream:
+            return fstream.read()
+    except FileNotFoundError:
+        return None
+
+
+def remove(fpath: pathlib.Path, root: pathlib.Path):
+    """Removes a file together with any parent directories (beneath root) left empty.
+
+    :param fpath: Target file path.
+    :param root: Directory beneath which empty parent directories are removed.
+
+    """
+    fpath.unlink(missing_ok=True)
+
+    dpath = fpath.parent
+    while dpath != root and dpath.exists() and not any(dpath.iterdir()):
+        dpath.rmdir()
+        dpath = dpath.parent
+
+
+def write(fpath: pathlib.Path, content: str) -> WriteStatus:
     """Simple sink function to write file contents to file system.
 
-    Useful so as to simplify suspending writing when testing.
+    Useful so as to simplify suspending writing when testing.  Files whose
+    content is unchanged are not rewritten so as to preserve their mtime.
 
     :param fpath: Target file path.
     :param content: File content to be written.
+    :returns: Outcome of write operation.
 
     """
+    if fpath.exists():
+        with open(fpath, "r") as fstream:
+            if fstream.read() == content:
+                return WriteStatus.unchanged
+        status = WriteStatus.updated
+    else:
+        status = WriteStatus.created
+
     if not fpath.parent.exists():
         fpath.parent.mkdir(parents=True)
     with open(fpath, "w") as fstream:
         fstream.write(content)
 
+    return status
+
 
 def yield_funcset(
     dictionary: model.Dictionary,
@@ -51,24 +165,43 @@ def yield_funcset(
 ) -> typing.Tuple[model.Contract, model.FunctionType, str]:
     """Yields set of functions for which code can be emitted.
 
-    In actus-core.functions there is a sub-package for each supported contract type.
-    Within each sub-package is the set of contract specific functions.  Each such
-    function is named: {func-type}_{event-type}_{contract-type}.java.
-
     :param dictionary: ACTUS dictionary wrapper.
     :param path_to_java_funcs: Path to functions defined in actus-core.
     :param f_type: Type of ACTUS function to be processed.
     :returns: Iterator over set of functions declared in actus-core.
 
     """
+    funcset = get_funcset(path_to_java_funcs)
     for contract in dictionary.contract_set:
-        path_to_java_funcs_contract = path_to_java_funcs / contract.type_info.acronym.lower()
-        if path_to_java_funcs_contract.exists() and path_to_java_funcs_contract.is_dir():
-            iterator = (i.stem.split("_") for i in path_to_java_funcs_contract.iterdir())
-            for (func_type, event_type, suffix) in iterator:
-                if f_type.name == func_type:
-                    suffix = suffix[-1] if suffix[-1].isnumeric() else ""
-                    yield contract, event_type, suffix
+        for func in funcset.get_functions(contract.acronym, f_type):
+            yield contract, func.event_type, func.suffix
+
+
+def _scan_funcset(
+    path_to_java_funcs: pathlib.Path,
+    folders: typing.List[typing.Tuple[str, int]]
+) -> model.FunctionSet:
+    """Scans set of contract sub-packages for declared functions.
+
+    """
+    items = []
+    for folder, _ in folders:
+        with os.scandir(path_to_java_funcs / folder) as iterator:
+            for entry in iterator:
+                if not entry.is_file():
+                    continue
+                parts = os.path.splitext(entry.name)[0].split("_")
+                if len(parts) != 3 or parts[0] not in model.FunctionType.__members__:
+                    continue
+                func_type, event_type, suffix = parts
+                items.append(model.Function(
+                    contract_acronym=folder.upper(),
+                    event_type=event_type,
+                    func_type=model.FunctionType[func_type],
+                    suffix=suffix[-1] if suffix[-1].isnumeric() else ""
+                ))
+
+    return model.FunctionSet(items)
 
 
 def _get_codegen_env(lang: TargetLanguage) -> jinja2.Environment:
@@ -80,5 +213,21 @@ def _get_codegen_env(lang: TargetLanguage) -> jinja2.Environment:
     return jinja2.Environment(
         loader=jinja2.FileSystemLoader(path_to_templates),
         autoescape=jinja2.select_autoescape(),
+        bytecode_cache=_get_codegen_bytecode_cache(),
         trim_blocks=True
     )
+
+
+def _get_codegen_bytecode_cache() -> typing.Optional[jinja2.BytecodeCache]:
+    """Factory: returns cache of compiled templates shared across processes.
+
+    Cached bytecode is keyed by template name and invalidated whenever the
+    checksum of the template source changes.
+
+    """
+    try:
+        path_to_cache = get_path_to_cache("templates")
+    except OSError:
+        return None
+
+    return jinja2.FileSystemBytecodeCache(str(path_to_cache))
@@ -0,0 +1,390 @@
+import io
+import json
+import os
+import pathlib
+import tarfile
+import time
+import typing
+import zipfile
+
+import actusmp
+from actusmp.codegen.enums import OutputSink
+from actusmp.codegen.enums import WriteStatus
+from actusmp.utils import fsys
+
+# Name of manifest file recording set of files emitted into an output directory.
+_MANIFEST_FNAME: str = ".actusmp-manifest.json"
+
+# Map: archive file suffix(es) <-> tarfile compression (None denotes a zip archive).
+_ARCHIVE_FORMATS: typing.Dict[str, typing.Optional[str]] = {
+    ".tar": "",
+    ".tar.gz": "gz",
+    ".tgz": "gz",
+    ".tar.bz2": "bz2",
+    ".tar.xz": "xz",
+    ".zip": None,
+}
+
+
+class Sink():
+    """Destination to which emitted code blocks are written.
+
+    Sinks are context managers, upon exit any buffered output is flushed, unless exiting
+    upon an exception in which case output that has yet to be committed is discarded.
+
+    """
+    def __enter__(self) -> "Sink":
+        """Context entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context exit: flushes buffered output, or discards it upon an exception."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def close(self):
+        """Flushes any buffered output & releases associated resources.
+
+        """
+        pass
+
+    def discard(self):
+        """Releases associated resources without committing output that has yet to be committed.
+
+        By default buffered output is flushed, i.e. sinks that write to file system file by
+        file leave files written prior to a failure in place.
+
+        """
+        self.close()
+
+    def read(self, fpath: pathlib.Path) -> typing.Optional[str]:
+        """Returns content of a previously written file.
+
+        :param fpath: Target file path.
+        :returns: File content if file exists, otherwise None.
+
+        """
+        raise NotImplementedError()
+
+    def remove(self, fpath: pathlib.Path, root: pathlib.Path):
+        """Removes a previously written file.
+
+        :param fpath: Target file path.
+        :param root: Output directory beneath which the file was written.
+
+        """
+        raise NotImplementedError()
+
+    def write(self, fpath: pathlib.Path, content: str) -> WriteStatus:
+        """Writes a file unless its content is unchanged.
+
+        :param fpath: Target file path.
+        :param content: File content to be written.
+        :returns: Outcome of write operation.
+
+        """
+        raise NotImplementedError()
+
+    def prune(self, dest: pathlib.Path, fname: str, content_hash: str) -> bool:
+        """Removes a previously emitted file unless it has since been edited.
+
+        :param dest: Output directory.
+        :param fname: Path of file relative to output directory.
+        :param content_hash: Hash of file content when it was emitted.
+        :returns: True if file was removed, False if file has since been edited.
+
+        """
+        content = self.read(dest / fname)
+        if content is not None and fsys.get_hash(content) != content_hash:
+            return False
+        self.remove(dest / fname, dest)
+
+        return True
+
+    def read_manifest(self, dest: pathlib.Path) -> typing.Tuple[typing.Dict[str, str], typing.Dict[str, str]]:
+        """Returns manifest of files previously emitted into an output directory.
+
+        :param dest: Output directory.
+        :returns: 2 member tuple: map of relative file path to content hash, map of relative file path to source.
+
+        """
+        try:
+            manifest = json.loads(self.read(dest / _MANIFEST_FNAME) or "{}")
+            return manifest["files"], manifest.get("sources", dict())
+        except (OSError, ValueError, KeyError):
+            return dict(), dict()
+
+    def write_manifest(
+        self,
+        dest: pathlib.Path,
+        files: typing.Dict[str, str],
+        sources: typing.Dict[str, typing.Optional[str]]
+    ):
+        """Writes manifest of files emitted into an output directory.
+
+        :param dest: Output directory.
+        :param files: Map of relative file path to content hash.
+        :param sources: Map of relative file path to source, i.e. generator (and contract) from which it was emitted.
+
+        """
+        self.write(dest / _MANIFEST_FNAME, json.dumps({
+            "version": actusmp.__version__,
+            "files": dict(sorted(files.items())),
+            "sources": {i: sources[i] for i in sorted(sources) if sources[i] is not None},
+        }, indent=4))
+
+
+class DirectorySink(Sink):
+    """Sink writing each file to file system as soon as it is emitted.
+
+    """
+    def read(self, fpath: pathlib.Path) -> typing.Optional[str]:
+        """Returns content of a previously written file."""
+        return fsys.read(fpath)
+
+    def remove(self, fpath: pathlib.Path, root: pathlib.Path):
+        """Removes a previously written file together with any parent directories left empty."""
+        fsys.remove(fpath, root)
+
+    def write(self, fpath: pathlib.Path, content: str) -> WriteStatus:
+        """Writes a file unless its content is unchanged."""
+        return fsys.write(fpath, content)
+
+
+class BatchedDirectorySink(Sink):
+    """Sink buffering emitted files & writing them to file system in bulk.
+
+    Each directory is listed at most once in order to determine which files already
+    exist, and created at most once when a batch is flushed, thus avoiding a set of
+    per file stat & mkdir calls that are costly over network file systems.
+
+    """
+    def __init__(self, batch_size: int = 1000):
+        """Instance constructor.
+
+        :param batch_size: Number of buffered files above which a batch is flushed.
+
+        """
+        # Number of buffered files above which a batch is flushed.
+        self.batch_size: int = batch_size
+
+        # Map: directory <-> names of files known to exist within it.
+        self._listings: typing.Dict[str, typing.Set[str]] = dict()
+
+        # Set of directories found to be missing & thus to be created upon flush.
+        self._missing: typing.Set[str] = set()
+
+        # Map: file path <-> content pending write.
+        self._pending: typing.Dict[pathlib.Path, str] = dict()
+
+    def close(self):
+        """Flushes any buffered output."""
+        self.flush()
+
+    def discard(self):
+        """Drops buffered output without writing it, leaving files flushed by a previous batch in place."""
+        self._pending.clear()
+        self._missing.clear()
+        self._listings.clear()
+
+    def flush(self):
+        """Writes buffered files to file system, creating each missing directory once.
+
+        """
+        for dpath in sorted(self._missing):
+            os.makedirs(dpath, exist_ok=True)
+        self._missing.clear()
+        for fpath, content in self._pending.items():
+            with open(fpath, "w") as fstream:
+                fstream.write(content)
+        self._pending.clear()
+
+    def read(self, fpath: pathlib.Path) -> typing.Optional[str]:
+        """Returns content of a previously written file."""
+        dpath, fname = os.path.split(fpath)
+        content = self._pending.get(fpath)
+        if content is None and fname in self._get_listing(dpath):
+            content = fsys.read(fpath)
+
+        return content
+
+    def remove(self, fpath: pathlib.Path, root: pathlib.Path):
+        """Removes a previously written file together with any parent directories left empty."""
+        self.flush()
+        fsys.remove(fpath, root)
+        self._listings.clear()
+
+    def write(self, fpath: pathlib.Path, content: str) -> WriteStatus:
+        """Buffers a file for writing unless its content is unchanged."""
+        dpath, fname = os.path.split(fpath)
+        listing = self._get_listing(dpath)
+        current = self._pending.get(fpath)
+        if current is None and fname in listing:
+            current = fsys.read(fpath)
+        if current == content:
+            return WriteStatus.unchanged
+
+        self._pending[fpath] = content
+        listing.add(fname)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+        return WriteStatus.created if current is None else WriteStatus.updated
+
+    def _get_listing(self, dpath: str) -> typing.Set[str]:
+        """Returns names of files known to exist within a directory, listing it upon first request.
+
+        """
+        if dpath not in self._listings:
+            try:
+                with os.scandir(dpath) as iterator:
+                    self._listings[dpath] = {i.name for i in iterator}
+            except FileNotFoundError:
+                self._listings[dpath] = set()
+                self._missing.add(dpath)
+
+        return self._listings[dpath]
+
+
+class ArchiveSink(Sink):
+    """Sink streaming emitted files into a single tar or zip archive.
+
+    The archive path stands in for the output directory, i.e. files written beneath it
+    are archived relative to it.  The archive is written afresh each run, hence all
+    files are reported as created and none are ever stale.  Format is derived from the
+    archive file suffix, e.g. '.zip' | '.tar.gz'.
+
+    """
+    def __init__(self, fpath: pathlib.Path):
+        """Instance constructor.
+
+        :param fpath: Path to archive file.
+
+        """
+        suffix = next((i for i in _ARCHIVE_FORMATS if fpath.name.endswith(i)), None)
+        if suffix is None:
+            raise ValueError(f"Unsupported archive format: {fpath.name} (expected one of {', '.join(_ARCHIVE_FORMATS)})")
+
+        # Path to archive file.
+        self.fpath: pathlib.Path = fpath
+
+        # Map: archived file name <-> content hash.
+        self.members: typing.Dict[str, str] = dict()
+
+        # Archive is written to a temporary file, opened upon first write, so that a partial archive never replaces a previous one.
+        self._fpath_tmp = fpath.with_name(f"{fpath.name}.{os.getpid()}.tmp")
+        self._compression = _ARCHIVE_FORMATS[suffix]
+        self._archive: typing.Optional[typing.Union[tarfile.TarFile, zipfile.ZipFile]] = None
+        self._mtime = time.time()
+
+    def close(self):
+        """Finalises archive & moves it into place."""
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+            os.replace(self._fpath_tmp, self.fpath)
+
+    def discard(self):
+        """Abandons archive, leaving any previous archive in place."""
+        if self._archive is not None:
+            try:
+                self._archive.close()
+            finally:
+                self._archive = None
+                self._fpath_tmp.unlink(missing_ok=True)
+
+    def read(self, fpath: pathlib.Path) -> typing.Optional[str]:
+        """Returns None: archive is written afresh, hence no file was previously written."""
+        return None
+
+    def remove(self, fpath: pathlib.Path, root: pathlib.Path):
+        """Ignored: archive is written afresh, hence no file was previously written."""
+        pass
+
+    def write(self, fpath: pathlib.Path, content: str) -> WriteStatus:
+        """Appends a file to archive."""
+        name = fpath.relative_to(self.fpath).as_posix()
+        content_hash = fsys.get_hash(content)
+        if self.members.get(name) == content_hash:
+            return WriteStatus.unchanged
+        status = WriteStatus.created if name not in self.members else WriteStatus.updated
+        self.members[name] = content_hash
+
+        if self._archive is None:
+            self._archive = self._open()
+
+        data = content.encode("utf-8")
+        if isinstance(self._archive, zipfile.ZipFile):
+            info = zipfile.ZipInfo(name, time.localtime(self._mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = self._mtime
+            info.mode = 0o644
+            self._archive.addfile(info, io.BytesIO(data))
+
+        return status
+
+    def _open(self) -> typing.Union[tarfile.TarFile, zipfile.ZipFile]:
+        """Opens temporary archive file for writing.
+
+        """
+        self.fpath.parent.mkdir(parents=True, exist_ok=True)
+        if self._compression is None:
+            return zipfile.ZipFile(self._fpath_tmp, "w", compression=zipfile.ZIP_DEFLATED)
+
+        return tarfile.open(self._fpath_tmp, f"w:{self._compression}")
+
+
+class MemorySink(Sink):
+    """Sink retaining emitted files in memory, e.g. for testing & tooling.
+
+    """
+    def __init__(self, files: typing.Optional[typing.Dict[pathlib.Path, str]] = None):
+        """Instance constructor.
+
+        :param files: Files deemed to have been previously written.
+
+        """
+        # Map: file path <-> content.
+        self.files: typing.Dict[pathlib.Path, str] = dict(files or {})
+
+    def read(self, fpath: pathlib.Path) -> typing.Optional[str]:
+        """Returns content of a previously written file."""
+        return self.files.get(fpath)
+
+    def remove(self, fpath: pathlib.Path, root: pathlib.Path):
+        """Removes a previously written file."""
+        self.files.pop(fpath, None)
+
+    def write(self, fpath: pathlib.Path, content: str) -> WriteStatus:
+        """Retains a file unless its content is unchanged."""
+        current = self.files.get(fpath)
+        if current == content:
+            return WriteStatus.unchanged
+        self.files[fpath] = content
+
+        return WriteStatus.created if current is None else WriteStatus.updated
+
+
+def get_sink(typeof: OutputSink, dest: pathlib.Path) -> Sink:
+    """Factory: returns a sink to which emitted code is written.
+
+    :param typeof: Type of sink.
+    :param dest: Output directory, or archive file path when archiving.
+    :returns: A sink.
+
+    """
+    if typeof == OutputSink.directory:
+        return DirectorySink()
+    elif typeof == OutputSink.batched:
+        return BatchedDirectorySink()
+    elif typeof == OutputSink.archive:
+        return ArchiveSink(dest)
+    elif typeof == OutputSink.memory:
+        return MemorySink()
+    raise ValueError(f"Unsupported output sink: {typeof}")
@@ -0,0 +1,379 @@
+import argparse
+import contextlib
+import copy
+import dataclasses
+import io
+import json
+import os
+import pathlib
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+import typing
+import unittest.mock
+
+import actusmp
+from actusmp.codegen import convertor
+from actusmp.codegen import generator
+from actusmp.codegen.enums import OutputSink
+from actusmp.codegen.enums import TargetGenerator
+from actusmp.dictionary import factory
+from actusmp.dictionary import parser
+from actusmp.dictionary import snapshot
+from actusmp.dictionary.accessor import FILE
+from actusmp.utils import fsys
+from actusmp.utils import sinks
+
+# CLI argument parser.
+_ARGS = argparse.ArgumentParser("Times each stage of the code generation pipeline.")
+
+# Set CLI argument: dictionary scale factors.
+_ARGS.add_argument(
+    "--scales",
+    default="1,10,100",
+    dest="scales",
+    help="Comma separated set of factors by which the bundled dictionary is synthetically scaled.",
+    type=lambda x: [int(i) for i in x.split(",")]
+    )
+
+# Set CLI argument: target programming language(s).
+_ARGS.add_argument(
+    "--lang",
+    default=list(actusmp.TargetLanguage),
+    dest="langs",
+    help="Comma separated set of target programming languages to be rendered.",
+    type=lambda x: [actusmp.TargetLanguage[i] for i in x.split(",")]
+    )
+
+# Set CLI argument: number of repeats per stage.
+_ARGS.add_argument(
+    "--repeats",
+    default=3,
+    dest="repeats",
+    help="Number of times each stage is timed - the fastest is retained.",
+    type=int
+    )
+
+# Set CLI argument: number of instances over which memory usage is averaged.
+_ARGS.add_argument(
+    "--instances",
+    default=10000,
+    dest="instances",
+    help="Number of generated class instances over which memory usage is averaged.",
+    type=int
+    )
+
+# Set CLI argument: path to results file.
+_ARGS.add_argument(
+    "--output",
+    dest="output",
+    help="Path to JSON file into which results will be written.",
+    type=pathlib.Path
+    )
+
+# Set CLI argument: path to baseline results file.
+_ARGS.add_argument(
+    "--baseline",
+    dest="baseline",
+    help="Path to JSON file of previous results against which regressions are detected.",
+    type=pathlib.Path
+    )
+
+# Set CLI argument: regression threshold.
+_ARGS.add_argument(
+    "--threshold",
+    default=1.25,
+    dest="threshold",
+    help="Ratio of current to baseline timing above which a stage is deemed to have regressed.",
+    type=float
+    )
+
+# Set CLI argument: regression minimum delta.
+_ARGS.add_argument(
+    "--min-delta",
+    default=0.005,
+    dest="min_delta",
+    help="Absolute slow down (in seconds) below which a stage is never deemed to have regressed.",
+    type=float
+    )
+
+# Set of event types declared within synthetic actus-core function tree.
+_EVENT_TYPES: typing.Tuple[str] = ("AD", "FP", "IED", "IP", "IPCI", "MD", "PR", "PRD", "RR", "SC", "TD")
+
+
+def _main(args: argparse.Namespace):
+    """Main entry point.
+
+    :param args: Parsed command line arguments.
+
+    """
+    results = dict()
+    # Snapshots are written to a throwaway cache so that the user's cache is neither evicted nor polluted.
+    with tempfile.TemporaryDirectory() as tmpdir, \
+         unittest.mock.patch.dict(os.environ, {"ACTUSMP_CACHE_DIR": str(pathlib.Path(tmpdir) / "cache")}):
+        for scale in args.scales:
+            print(f"Benchmarking dictionary scaled {scale}x ...")
+            path_to_dictionary = _write_dictionary(pathlib.Path(tmpdir) / f"{scale}x", scale)
+            for stage, elapsed in _yield_timings(args, path_to_dictionary):
+                results[f"{scale}x|{stage}"] = elapsed
+
+        print("Benchmarking memory usage of generated code ...")
+        for stage, size in _yield_memory_usage(args):
+            results[f"memory|{stage}"] = size
+
+    _print_results(results)
+    if args.output:
+        with open(args.output, "w") as fstream:
+            json.dump(results, fstream, indent=4)
+    if args.baseline:
+        with open(args.baseline, "r") as fstream:
+            regressions = _get_regressions(args, json.load(fstream), results)
+        for key, baseline, current in regressions:
+            print(f"REGRESSION :: {key} :: {baseline:.4f} -> {current:.4f}")
+        if regressions:
+            sys.exit(1)
+
+
+def _yield_timings(args: argparse.Namespace, path_to_dictionary: pathlib.Path):
+    """Yields set of (stage, elapsed seconds) timings over a dictionary.
+
+    """
+    def _time(action: typing.Callable, setup: typing.Callable = lambda: None):
+        timings = []
+        for _ in range(args.repeats):
+            state = setup()
+            with contextlib.redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                result = action(state)
+                timings.append(time.perf_counter() - started)
+        return min(timings), result
+
+    # Dictionary: load -> parse -> model build (single component | all components) -> snapshot round trip.
+    content = path_to_dictionary.read_text()
+    elapsed, obj = _time(lambda _: json.loads(content))
+    yield "json-load", elapsed
+
+    elapsed, _ = _time(parser.parse, lambda: copy.deepcopy(obj))
+    yield "parse", elapsed
+
+    elapsed, _ = _time(lambda _: factory.get_dictionary(path_to_dictionary, use_cache=False).contract_type)
+    yield "model-build-lazy", elapsed
+
+    elapsed, dictionary = _time(lambda _: factory.get_dictionary(path_to_dictionary, use_cache=False).materialise())
+    yield "model-build", elapsed
+
+    elapsed, _ = _time(lambda _: pickle.loads(pickle.dumps(dictionary, protocol=pickle.HIGHEST_PROTOCOL)))
+    yield "snapshot-round-trip", elapsed
+
+    # Dictionary (opt-in snapshot cache): cache miss -> snapshot save -> cache hit, to be weighed against model-build.
+    key = snapshot.get_key(path_to_dictionary)
+    elapsed, _ = _time(
+        lambda _: factory.get_dictionary(path_to_dictionary, use_cache=True).contract_type, lambda: snapshot.discard(key)
+        )
+    yield "model-build-cached-cold", elapsed
+
+    def _get_unsaved():
+        snapshot.discard(key)
+        return factory.get_dictionary(path_to_dictionary, use_cache=False)
+
+    elapsed, _ = _time(lambda lazy: factory.save_dictionary(lazy, path_to_dictionary), _get_unsaved)
+    yield "snapshot-save", elapsed
+
+    elapsed, _ = _time(lambda _: factory.get_dictionary(path_to_dictionary, use_cache=True).contract_type)
+    yield "model-build-cached-warm", elapsed
+    snapshot.discard(key)
+
+    # Function tree: scan.
+    path_to_java_funcs = _write_java_funcs(path_to_dictionary.parent / "functions", dictionary)
+    elapsed, funcset = _time(lambda _: fsys.get_funcset(path_to_java_funcs, use_cache=False))
+    yield "funcset-scan", elapsed
+
+    # Rendering: per language per generator.
+    code_blocks = []
+    for lang in args.langs:
+        for typeof in generator.get_generators(lang, actusmp.GeneratorOptions()):
+            ctx = generator.GeneratorContext(lang, typeof, dictionary, path_to_java_funcs, funcset)
+            elapsed, rendered = _time(lambda _: [i for i, _ in generator.generate(ctx)])
+            yield f"render|{lang.name}|{typeof.name}", elapsed
+            code_blocks += [(f"{lang.name}/{typeof.name}/{idx}.txt", i) for idx, i in enumerate(rendered)]
+
+    # Output sinks: cold write -> warm (unchanged) write | archive | memory.
+    def _get_writer(typeof: OutputSink, dest: pathlib.Path):
+        def _write(_):
+            with sinks.get_sink(typeof, dest) as sink:
+                for fname, code_block in code_blocks:
+                    sink.write(dest / fname, code_block)
+        return _write
+
+    for typeof, suffix in ((OutputSink.directory, ""), (OutputSink.batched, "-batched")):
+        dest = path_to_dictionary.parent / f"output{suffix}"
+        elapsed, _ = _time(_get_writer(typeof, dest), lambda: shutil.rmtree(dest, ignore_errors=True))
+        yield f"write-cold{suffix}", elapsed
+
+        elapsed, _ = _time(_get_writer(typeof, dest))
+        yield f"write-warm{suffix}", elapsed
+
+    elapsed, _ = _time(_get_writer(OutputSink.archive, path_to_dictionary.parent / "output.tar"))
+    yield "write-archive", elapsed
+
+    elapsed, _ = _time(_get_writer(OutputSink.memory, path_to_dictionary.parent / "output"))
+    yield "write-memory", elapsed
+
+
+def _yield_memory_usage(args: argparse.Namespace):
+    """Yields set of (stage, bytes per instance) measurements of generated python classes.
+
+    Generated code is executed against minimal stand-ins for the pyactus modules it imports.
+    Slotted termsets are measured only under python 3.10+, upon which their generated code depends.
+
+    """
+    dictionary = factory.get_dictionary()
+    contract = dictionary.contract_set.get_contract_by_acronym("PAM")
+    for slots in (False, True) if sys.version_info >= (3, 10) else (False, ):
+        ctx = generator.GeneratorContext(
+            actusmp.TargetLanguage.python,
+            TargetGenerator.Termset,
+            dictionary,
+            None,
+            options=actusmp.GeneratorOptions(py_slotted_termsets=slots)
+            )
+        with contextlib.redirect_stdout(io.StringIO()):
+            code_block = generator.render(ctx, contract)
+        cls = _exec_py_termset(code_block, slots)[f"{convertor.to_camel_case(contract.identifier)}Termset"]
+
+        tracemalloc.start()
+        instances = [cls() for _ in range(args.instances)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del instances
+
+        yield f"py-termset|{'slots' if slots else 'dict'}", size / args.instances
+
+
+def _exec_py_termset(code_block: str, slots: bool) -> dict:
+    """Executes a generated python termset module, returning its namespace.
+
+    """
+    class _AnyType(type):
+        def __getattr__(cls, name):
+            return cls
+
+    class _Any(metaclass=_AnyType):
+        pass
+
+    @dataclasses.dataclass
+    class ContractTermset():
+        if slots:
+            __slots__ = ()
+
+    core = types.ModuleType("pyactus.types.core")
+    core.__getattr__ = lambda _: _Any
+    core.ContractTermset = ContractTermset
+    enums = types.ModuleType("pyactus.types.enums")
+    enums.__getattr__ = lambda _: _Any
+    package = types.ModuleType("pyactus.types")
+    package.core = core
+    package.enums = enums
+
+    namespace = {"__name__": "termset"}
+    modules = {"pyactus": types.ModuleType("pyactus"), "pyactus.types": package}
+    with unittest.mock.patch.dict(sys.modules, modules):
+        exec(code_block, namespace)
+
+    return namespace
+
+
+def _write_dictionary(dest: pathlib.Path, scale: int) -> pathlib.Path:
+    """Writes a synthetic dictionary derived from the bundled dictionary.
+
+    Contract types, terms, applicability & states are each cloned scale - 1 times,
+    clones being distinguished by a numeric suffix.
+
+    """
+    with open(FILE, "r") as fstream:
+        obj = json.load(fstream)
+
+    def _clone(item: dict, idx: int, fields: typing.Iterable[str]) -> dict:
+        item = copy.deepcopy(item)
+        for field in fields:
+            item[field] = f"{item[field]}{idx}"
+        return item
+
+    taxonomy = list(obj["taxonomy"].items())
+    terms = list(obj["terms"].items())
+    states = list(obj["states"].items())
+    applicability = list(obj["applicability"].items())
+    fields = ("identifier", "acronym", "name")
+
+    for idx in range(1, scale):
+        for key, item in taxonomy:
+            if item["acronym"] != "EXOTi":
+                obj["taxonomy"][f"{key}{idx}"] = _clone(item, idx, fields)
+        for key, item in terms:
+            if key not in ("contractType", "contractRole", "scalingEffect"):
+                obj["terms"][f"{key}{idx}"] = _clone(item, idx, fields)
+        for key, item in states:
+            obj["states"][f"{key}{idx}"] = _clone(item, idx, fields)
+        for key, item in applicability:
+            obj["applicability"][f"{key}{idx}"] = {
+                f"{k}{idx}" if f"{k}{idx}" in obj["terms"] else k: v for k, v in item.items()
+                }
+
+    dest.mkdir(parents=True)
+    with open(dest / "actus-dictionary.json", "w") as fstream:
+        json.dump(obj, fstream)
+
+    return dest / "actus-dictionary.json"
+
+
+def _write_java_funcs(dest: pathlib.Path, dictionary: actusmp.Dictionary) -> pathlib.Path:
+    """Writes a synthetic actus-core function tree derived from a dictionary.
+
+    """
+    for contract in dictionary.contract_set:
+        folder = dest / contract.acronym.lower()
+        folder.mkdir(parents=True)
+        for event_type in _EVENT_TYPES:
+            for f_type in ("POF", "STF"):
+                (folder / f"{f_type}_{event_type}_{contract.acronym}.java").touch()
+        (folder / f"POF_PR_{contract.acronym}2.java").touch()
+
+    return dest
+
+
+def _get_regressions(
+    args: argparse.Namespace,
+    baseline: typing.Dict[str, float],
+    results: typing.Dict[str, float]
+) -> typing.List[typing.Tuple[str, float, float]]:
+    """Returns set of stages whose timings have regressed against a baseline.
+
+    """
+    regressions = []
+    for key, current in results.items():
+        if key in baseline and current > baseline[key] * args.threshold:
+            if key.startswith("memory|") or current - baseline[key] > args.min_delta:
+                regressions.append((key, baseline[key], current))
+
+    return regressions
+
+
+def _print_results(results: typing.Dict[str, float]):
+    """Prints a summary table of timings & memory usage.
+
+    """
+    width = max(len(i) for i in results)
+    for key, value in results.items():
+        if key.startswith("memory|"):
+            print(f"{key.ljust(width)} {value:10.0f} bytes/instance")
+        else:
+            print(f"{key.ljust(width)} {value * 1000:10.2f} ms")
+
+
+# Entry point.
+if __name__ == "__main__":
+    _main(_ARGS.parse_args())
@@ -1,24 +1,57 @@
 import argparse
+import contextlib
 import pathlib
+import typing
+
 import actusmp
+from actusmp.codegen import profiler
+from actusmp.codegen.enums import TargetGenerator
+from actusmp.codegen.enums import OPTIONAL_GENERATORS
+from actusmp.codegen.enums import OutputSink
+from actusmp.dictionary.accessor import FILE
+from actusmp.utils import sinks
 
 # CLI argument parser.
 _ARGS = argparse.ArgumentParser("Writes code generated from ACTUS dictionary to file system.")
 
-# Set CLI argument: target programming language.
+
+def _parse_langs(arg: str) -> typing.List[actusmp.TargetLanguage]:
+    """Parses target programming language(s) argument, e.g. 'python,rust' | 'all'.
+
+    """
+    if arg == "all":
+        return list(actusmp.TargetLanguage)
+    try:
+        return [actusmp.TargetLanguage[i.strip()] for i in arg.split(",")]
+    except KeyError as err:
+        raise argparse.ArgumentTypeError(f"Unsupported target programming language: {err}")
+
+
+def _parse_generators(arg: str) -> typing.FrozenSet[TargetGenerator]:
+    """Parses generator type(s) argument, e.g. 'Portfolio'.
+
+    """
+    try:
+        return frozenset(TargetGenerator[i.strip()] for i in arg.split(","))
+    except KeyError as err:
+        raise argparse.ArgumentTypeError(f"Unsupported generator type: {err}")
+
+
+# Set CLI argument: target programming language(s).
 _ARGS.add_argument(
     "--lang",
-    choices=[i for i in actusmp.TargetLanguage],
     dest="lang",
-    help="Target programming language status.",
-    type=lambda x: actusmp.TargetLanguage[x]
+    help=f"Target programming language(s): comma separated subset of "
+         f"{','.join(i.name for i in actusmp.TargetLanguage)} | all.  "
+         f"When several are specified code is written to a sub-directory per language.",
+    type=_parse_langs
     )
 
 # Set CLI argument: output directory.
 _ARGS.add_argument(
     "--dest",
     dest="dest",
-    help="Target file system directory into which code will be written.",
+    help="Target file system directory into which code will be written (or archive file path when archiving).",
     type=pathlib.Path
     )
 
@@ -30,6 +63,104 @@ _ARGS.add_argument(
     type=pathlib.Path
     )
 
+# Set CLI argument: number of worker processes.
+_ARGS.add_argument(
+    "--jobs",
+    default=1,
+    dest="jobs",
+    help="Number of worker processes over which rendering is distributed.",
+    type=int
+    )
+
+# Set CLI argument: flag indicating whether stale files are to be removed.
+_ARGS.add_argument(
+    "--prune",
+    action="store_true",
+    dest="prune",
+    help="Remove files emitted by a previous run that are no longer generated (unless edited since).",
+    )
+
+# Set CLI argument: optional generators.
+_ARGS.add_argument(
+    "--extra",
+    default=frozenset(),
+    dest="extra_generators",
+    help=f"Optional generator(s) to execute in addition to the default set, together with the optional "
+         f"generators they depend upon: comma separated subset of "
+         f"{','.join(i.name for i in sorted(OPTIONAL_GENERATORS, key=lambda i: i.name))}.",
+    type=_parse_generators
+    )
+
+# Set CLI argument: selected contracts.
+_ARGS.add_argument(
+    "--contract",
+    dest="contracts",
+    help="Contract type(s) for which per contract code is emitted: comma separated set of acronyms, e.g. PAM,ANN.",
+    type=lambda x: frozenset(i.strip().upper() for i in x.split(","))
+    )
+
+# Set CLI argument: selected generators.
+_ARGS.add_argument(
+    "--generator",
+    dest="generators",
+    help="Generator(s) to execute (together with the index generators referencing their output): "
+         "comma separated set of generator types, e.g. Termset,FuncStubPOF.",
+    type=_parse_generators
+    )
+
+# Set CLI argument: flag indicating whether python termsets are slotted.
+_ARGS.add_argument(
+    "--py-slots",
+    action="store_true",
+    dest="py_slotted_termsets",
+    help="Emit python termset classes as slotted dataclasses (requires python 3.10+).",
+    )
+
+# Set CLI argument: path to dictionary file.
+_ARGS.add_argument(
+    "--dictionary",
+    default=FILE,
+    dest="path_to_dictionary",
+    help="Path to actus-dictionary.json file (default: bundled dictionary).",
+    type=pathlib.Path
+    )
+
+# Set CLI argument: flag indicating whether dictionary is streamed.
+_ARGS.add_argument(
+    "--stream-dictionary",
+    action="store_true",
+    dest="stream_dictionary",
+    help="Load dictionary section by section so as to bound peak memory when processing large dictionaries.",
+    )
+
+# Set CLI argument: flag indicating whether a dictionary snapshot is cached.
+_ARGS.add_argument(
+    "--cache-dictionary",
+    action="store_true",
+    dest="cache_dictionary",
+    help="Load the dictionary from, and save it to, a snapshot cache (marginal saving, hence off by default).",
+    )
+
+# Set CLI argument: output sink.
+_ARGS.add_argument(
+    "--sink",
+    choices=[i.name for i in OutputSink],
+    default=OutputSink.directory.name,
+    dest="sink",
+    help="Destination of emitted code: directory (file by file) | batched (directory, written in bulk) | "
+         "archive (single .tar, .tar.gz, .tgz, .tar.bz2, .tar.xz or .zip file at --dest) | memory (dry run).",
+    )
+
+# Set CLI argument: path to profiling trace file.
+_ARGS.add_argument(
+    "--profile",
+    const=pathlib.Path("actusmp-trace.json"),
+    dest="profile",
+    help="Print a per stage timing summary & write a Chrome trace event file (default: actusmp-trace.json).",
+    nargs="?",
+    type=pathlib.Path
+    )
+
 
 def _main(args: argparse.Namespace):
     """Main entry point.
@@ -37,7 +168,31 @@ def _main(args: argparse.Namespace):
     :param args: Parsed command line arguments.
 
     """
-    actusmp.write(args.lang, args.dest, args.path_to_core)
+    prof = profiler.Profiler()
+    with prof if args.profile else contextlib.nullcontext():
+        report = actusmp.write(
+            args.lang,
+            args.dest,
+            args.path_to_core,
+            args.jobs,
+            args.prune,
+            actusmp.GeneratorOptions(
+                extra_generators=args.extra_generators,
+                py_slotted_termsets=args.py_slotted_termsets
+                ),
+            args.path_to_dictionary,
+            args.stream_dictionary,
+            args.contracts,
+            args.generators,
+            sinks.get_sink(OutputSink[args.sink], args.dest),
+            args.cache_dictionary
+            )
+    print(f"Code written to {args.dest} :: {report}")
+
+    if args.profile:
+        print(prof.get_summary())
+        prof.write_trace(args.profile)
+        print(f"Trace written to {args.profile}")
 
 
 # Entry point.
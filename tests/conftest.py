@@ -0,0 +1,134 @@
+import datetime
+import importlib
+import pathlib
+import sys
+import typing
+
+import pytest
+
+import actusmp
+from actusmp.codegen import convertor
+from actusmp.codegen.enums import TargetGenerator
+from actusmp.codegen.enums import TargetLanguage
+from actusmp.model import Contract
+from actusmp.model import Term
+
+
+# Hand-written pyactus core types referenced by generated code.
+_PYACTUS_CORE: str = '''import dataclasses
+
+
+@dataclasses.dataclass
+class ContractTermset():
+    pass
+
+
+class Cycle(str):
+    pass
+
+
+class Period(str):
+    pass
+
+
+class ContractReference(str):
+    pass
+'''
+
+# Map: codec wire type <-> term value assigned to a termset under test.
+_TERM_VALUES: typing.Dict[str, typing.Any] = {
+    "Real": 1.5,
+    "Timestamp": datetime.datetime(2020, 1, 2, 3, 4, 5),
+    "Varchar": "é-x",
+}
+
+# Map: text encoded scalar type <-> term value assigned to a termset under test.
+_TERM_TEXT_VALUES: typing.Dict[str, str] = {
+    "ContractReference": '{"object": "PAM-01"}',
+    "Cycle": "P1ML1",
+    "Period": "P0D",
+}
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cache_dir(tmp_path_factory) -> pathlib.Path:
+    """Points the local cache at a throwaway folder so that tests neither read nor pollute the user's cache.
+
+    """
+    path = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("ACTUSMP_CACHE_DIR", str(path))
+        yield path
+
+
+@pytest.fixture
+def path_to_java_impl(tmp_path) -> pathlib.Path:
+    """Path to an (empty) actus-core function tree, i.e. one declaring no functions.
+
+    """
+    path = tmp_path / "java"
+    path.mkdir()
+
+    return path
+
+
+@pytest.fixture(scope="session")
+def pyactus(tmp_path_factory) -> pathlib.Path:
+    """Path to a generated pyactus package, inclusive of portfolios, stores & codecs, made importable for the session.
+
+    """
+    path_to_java_impl = tmp_path_factory.mktemp("java")
+    path = tmp_path_factory.mktemp("pyactus") / "pyactus"
+    path.mkdir()
+    actusmp.write(
+        TargetLanguage.python,
+        path,
+        path_to_java_impl,
+        options=actusmp.GeneratorOptions(extra_generators=frozenset({
+            TargetGenerator.Portfolio,
+            TargetGenerator.PortfolioStore,
+            TargetGenerator.TermsetCodec,
+        }))
+        )
+    (path / "types" / "core").mkdir(exist_ok=True)
+    with open(path / "types" / "core" / "__init__.py", "w") as fstream:
+        fstream.write(_PYACTUS_CORE)
+
+    sys.path.insert(0, str(path.parent))
+    yield path
+    sys.path.remove(str(path.parent))
+    for name in [i for i in sys.modules if i == "pyactus" or i.startswith("pyactus.")]:
+        del sys.modules[name]
+
+
+@pytest.fixture(scope="session")
+def get_termset(pyactus) -> typing.Callable[[Contract, bool], typing.Any]:
+    """Factory returning a generated termset assigned a value per codec term, i.e. all terms but the contract type.
+
+    """
+    def _get_value(term: Term) -> typing.Any:
+        wire_type = convertor.to_codec_wire_type(term)
+        if wire_type == "Enum":
+            enums = importlib.import_module("pyactus.types.enums")
+            value = list(getattr(enums, convertor.to_camel_case(term.identifier)))[0]
+        elif term.scalar_type.name in _TERM_TEXT_VALUES:
+            value = _TERM_TEXT_VALUES[term.scalar_type.name]
+        else:
+            value = _TERM_VALUES[wire_type]
+
+        return [value, value] if term.is_array else value
+
+    def _get_termset(contract: Contract, is_empty: bool = False) -> typing.Any:
+        terms = importlib.import_module(f"pyactus.types.terms.{contract.acronym.lower()}")
+        core = importlib.import_module("pyactus.types.core")
+        typeof = next(
+            i for i in vars(terms).values()
+            if isinstance(i, type) and issubclass(i, core.ContractTermset) and i is not core.ContractTermset
+            )
+
+        return typeof(**{
+            convertor.to_underscore_case(i.identifier): None if is_empty else _get_value(i)
+            for i in convertor.to_codec_terms(contract)
+            })
+
+    return _get_termset
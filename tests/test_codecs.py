@@ -0,0 +1,43 @@
+import dataclasses
+import importlib
+
+import pytest
+
+from actusmp.dictionary.factory import get_dictionary
+
+
+# Set of contracts declaring a termset.
+_CONTRACTS = [i for i in get_dictionary().contract_set if i.term_set]
+
+
+def _get_codec(contract):
+    """Returns generated codec module of a contract.
+
+    """
+    return importlib.import_module(f"pyactus.types.codecs.{contract.acronym.lower()}")
+
+
+@pytest.mark.parametrize("contract", _CONTRACTS, ids=lambda i: i.acronym)
+def test_codec_round_trips_termset(contract, get_termset):
+    codec = _get_codec(contract)
+    term_set = get_termset(contract)
+
+    buffer = codec.encode(term_set)
+    decoded, offset = codec.decode(buffer)
+
+    assert offset == len(buffer)
+    for field in dataclasses.fields(term_set):
+        assert getattr(decoded, field.name) == getattr(term_set, field.name), field.name
+
+
+@pytest.mark.parametrize("contract", _CONTRACTS, ids=lambda i: i.acronym)
+def test_codec_round_trips_empty_termset(contract, get_termset):
+    codec = _get_codec(contract)
+    term_set = get_termset(contract, is_empty=True)
+
+    buffer = codec.encode(term_set)
+    decoded, offset = codec.decode(b"\x00" + buffer, 1)
+
+    assert len(buffer) == codec.BITMAP_SIZE
+    assert offset == len(buffer) + 1
+    assert decoded == term_set
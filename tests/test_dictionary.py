@@ -0,0 +1,35 @@
+import dataclasses
+import json
+
+import pytest
+
+from actusmp.dictionary.accessor import FILE
+from actusmp.dictionary.factory import get_dictionary
+from actusmp.model import Dictionary
+
+
+def test_streamed_dictionary_matches_dictionary():
+    expected = get_dictionary(FILE).materialise()
+    actual = get_dictionary(FILE, stream=True).materialise()
+
+    for field in dataclasses.fields(Dictionary):
+        assert getattr(actual, field.name) == getattr(expected, field.name), field.name
+
+
+def test_streamed_dictionary_is_lazily_mapped():
+    dictionary = get_dictionary(FILE, stream=True)
+
+    assert not dictionary.is_materialised
+    assert len(dictionary.contract_set) > 0
+
+
+def test_streamed_dictionary_rejects_missing_sections(tmp_path):
+    with open(FILE) as fstream:
+        obj = json.load(fstream)
+    del obj["states"]
+    path = tmp_path / "actus-dictionary.json"
+    with open(path, "w") as fstream:
+        json.dump(obj, fstream)
+
+    with pytest.raises(ValueError, match="missing sections"):
+        get_dictionary(path, stream=True)
@@ -0,0 +1,96 @@
+import pathlib
+import tarfile
+import typing
+import zipfile
+
+import pytest
+
+import actusmp
+from actusmp.codegen.enums import TargetLanguage
+from actusmp.utils import sinks
+
+
+def _write(sink: sinks.Sink, dest: pathlib.Path, path_to_java_impl: pathlib.Path):
+    """Writes python code to a sink.
+
+    """
+    actusmp.write(TargetLanguage.python, dest, path_to_java_impl, sink=sink)
+
+
+def _read_directory(path: pathlib.Path) -> typing.Dict[str, str]:
+    """Returns map: relative file path <-> content of files written beneath a directory.
+
+    """
+    return {i.relative_to(path).as_posix(): i.read_text() for i in path.rglob("*") if i.is_file()}
+
+
+def _read_archive(fpath: pathlib.Path) -> typing.Dict[str, str]:
+    """Returns map: relative file path <-> content of files written to an archive.
+
+    """
+    if fpath.suffix == ".zip":
+        with zipfile.ZipFile(fpath) as archive:
+            return {i: archive.read(i).decode("utf-8") for i in archive.namelist()}
+
+    with tarfile.open(fpath) as archive:
+        return {i.name: archive.extractfile(i).read().decode("utf-8") for i in archive.getmembers()}
+
+
+@pytest.fixture
+def expected(path_to_java_impl, tmp_path) -> typing.Dict[str, str]:
+    """Map: relative file path <-> content of files written via a directory sink.
+
+    """
+    dest = tmp_path / "directory"
+    dest.mkdir()
+    _write(sinks.DirectorySink(), dest, path_to_java_impl)
+
+    return _read_directory(dest)
+
+
+def test_batched_sink_matches_directory_sink(expected, path_to_java_impl, tmp_path):
+    dest = tmp_path / "batched"
+    dest.mkdir()
+    _write(sinks.BatchedDirectorySink(batch_size=7), dest, path_to_java_impl)
+
+    assert _read_directory(dest) == expected
+
+
+@pytest.mark.parametrize("fname", ["pyactus.tar", "pyactus.tar.gz", "pyactus.zip"])
+def test_archive_sink_matches_directory_sink(expected, path_to_java_impl, tmp_path, fname):
+    dest = tmp_path / fname
+    _write(sinks.ArchiveSink(dest), dest, path_to_java_impl)
+
+    assert _read_archive(dest) == expected
+    assert [i.name for i in tmp_path.iterdir() if i.name.endswith(".tmp")] == []
+
+
+def test_memory_sink_matches_directory_sink(expected, path_to_java_impl, tmp_path):
+    dest = tmp_path / "memory"
+    sink = sinks.MemorySink()
+    _write(sink, dest, path_to_java_impl)
+
+    assert {i.relative_to(dest).as_posix(): j for i, j in sink.files.items()} == expected
+
+
+def test_batched_sink_discards_pending_files_upon_error(tmp_path):
+    sink = sinks.BatchedDirectorySink()
+    with pytest.raises(RuntimeError):
+        with sink:
+            sink.write(tmp_path / "pending" / "a.py", "# Pending.\n")
+            raise RuntimeError()
+
+    assert not (tmp_path / "pending").exists()
+
+
+def test_archive_sink_retains_previous_archive_upon_error(tmp_path):
+    fpath = tmp_path / "pyactus.tar"
+    with sinks.ArchiveSink(fpath) as sink:
+        sink.write(fpath / "a.py", "# Previous.\n")
+    with pytest.raises(RuntimeError):
+        with sinks.ArchiveSink(fpath) as sink:
+            sink.write(fpath / "a.py", "# Pending.\n")
+            raise RuntimeError()
+
+    assert _read_archive(fpath) == {"a.py": "# Previous.\n"}
+    assert [i.name for i in tmp_path.iterdir()] == ["pyactus.tar"]
@@ -0,0 +1,85 @@
+import importlib
+
+import numpy as np
+import pytest
+
+from actusmp.codegen import convertor
+from actusmp.dictionary.factory import get_dictionary
+
+
+# Set of contracts declaring a termset.
+_CONTRACTS = [i for i in get_dictionary().contract_set if i.term_set]
+
+# Set of contracts declaring an array term.
+_CONTRACTS_WITH_ARRAYS = [i for i in _CONTRACTS if any(j.is_array for j in i.term_set)]
+
+
+def _get_modules(contract):
+    """Returns generated portfolio & store modules of a contract.
+
+    """
+    acronym = contract.acronym.lower()
+
+    return (
+        importlib.import_module(f"pyactus.types.portfolios.{acronym}"),
+        importlib.import_module(f"pyactus.types.stores.{acronym}"),
+    )
+
+
+def _get_portfolio(contract, get_termset):
+    """Returns a portfolio of 2 contracts: one assigned a value per storable term, one assigned none.
+
+    """
+    portfolios, _ = _get_modules(contract)
+    term_set = get_termset(contract)
+    for term in contract.term_set:
+        if term.is_array:
+            setattr(term_set, convertor.to_underscore_case(term.identifier), None)
+    typeof = next(i for i in vars(portfolios).values() if isinstance(i, type) and hasattr(i, "from_records"))
+
+    return typeof.from_records([term_set, get_termset(contract, is_empty=True)])
+
+
+@pytest.mark.parametrize("contract", _CONTRACTS, ids=lambda i: i.acronym)
+def test_store_round_trips_portfolio(contract, get_termset, tmp_path):
+    _, store = _get_modules(contract)
+    portfolio = _get_portfolio(contract, get_termset)
+
+    store.write(tmp_path, portfolio)
+    version, size = store.read_header(tmp_path)
+    actual = store.read(tmp_path)
+
+    assert version == store.VERSION
+    assert size == len(actual) == 2
+    assert actual.columns.keys() == portfolio.columns.keys()
+    for name, column in portfolio.columns.items():
+        if store.COLUMNS.get(name) == "varchar":
+            assert list(actual.columns[name]) == list(column), name
+        else:
+            np.testing.assert_array_equal(actual.columns[name], column, err_msg=name)
+
+
+@pytest.mark.parametrize("contract", _CONTRACTS_WITH_ARRAYS, ids=lambda i: i.acronym)
+def test_store_rejects_array_values(contract, get_termset, tmp_path):
+    _, store = _get_modules(contract)
+    store.write(tmp_path, _get_portfolio(contract, get_termset))
+    portfolio = _get_portfolio(contract, get_termset)
+    term = next(i for i in contract.term_set if i.is_array)
+    name = convertor.to_underscore_case(term.identifier)
+    portfolio.columns[name][0] = getattr(get_termset(contract), name)
+
+    with pytest.raises(ValueError, match=name):
+        store.write(tmp_path, portfolio)
+
+    # Previous store remains readable.
+    assert len(store.read(tmp_path)) == 2
+
+
+def test_store_rejects_incompatible_layout(get_termset, tmp_path):
+    contracts = {i.acronym: i for i in _CONTRACTS}
+    _, store = _get_modules(contracts["PAM"])
+    _, other = _get_modules(contracts["ANN"])
+    store.write(tmp_path, _get_portfolio(contracts["PAM"], get_termset))
+
+    with pytest.raises(ValueError, match="Incompatible portfolio store"):
+        other.read(tmp_path)
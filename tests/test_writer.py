@@ -0,0 +1,111 @@
+import pathlib
+
+import actusmp
+from actusmp.codegen.enums import TargetGenerator
+from actusmp.codegen.enums import TargetLanguage
+from actusmp.utils import fsys
+from actusmp.utils import sinks
+
+
+# Output directory - files are retained in memory hence it is never created.
+_DEST: pathlib.Path = pathlib.Path("/pyactus")
+
+
+def _write(sink: sinks.Sink, path_to_java_impl: pathlib.Path, **kwargs) -> actusmp.codegen.writer.WriteReport:
+    """Writes python code to a memory sink.
+
+    """
+    return actusmp.write(TargetLanguage.python, _DEST, path_to_java_impl, sink=sink, **kwargs)
+
+
+def _add_stale(sink: sinks.MemorySink, fname: str, content: str, edited: bool = False, source: str = None):
+    """Declares a file as having been emitted by a previous run.
+
+    """
+    files, sources = sink.read_manifest(_DEST)
+    files[fname] = fsys.get_hash(content)
+    sources[fname] = source
+    sink.files[_DEST / fname] = f"{content}# Edited.\n" if edited else content
+    sink.write_manifest(_DEST, files, sources)
+
+
+def test_write_reports_unchanged_files_upon_rewrite(path_to_java_impl):
+    sink = sinks.MemorySink()
+    report = _write(sink, path_to_java_impl)
+    assert len(report.created) > 0
+    assert len(report.unchanged) == 0
+
+    report = _write(sink, path_to_java_impl)
+    assert len(report.created) == 0
+    assert len(report.updated) == 0
+    assert len(report.unchanged) > 0
+    assert len(report.stale) == 0
+
+
+def test_write_retains_stale_files_unless_pruning(path_to_java_impl):
+    sink = sinks.MemorySink()
+    _write(sink, path_to_java_impl)
+    _add_stale(sink, "types/terms/xxx.py", "# Stale.\n")
+
+    report = _write(sink, path_to_java_impl)
+    assert report.stale == [_DEST / "types/terms/xxx.py"]
+    assert report.pruned == []
+    assert _DEST / "types/terms/xxx.py" in sink.files
+
+    # Retained within manifest so that it continues to be reported.
+    report = _write(sink, path_to_java_impl)
+    assert report.stale == [_DEST / "types/terms/xxx.py"]
+
+
+def test_write_prunes_stale_files(path_to_java_impl):
+    sink = sinks.MemorySink()
+    _write(sink, path_to_java_impl)
+    _add_stale(sink, "types/terms/xxx.py", "# Stale.\n")
+
+    report = _write(sink, path_to_java_impl, prune=True)
+    assert report.stale == [_DEST / "types/terms/xxx.py"]
+    assert report.pruned == [_DEST / "types/terms/xxx.py"]
+    assert _DEST / "types/terms/xxx.py" not in sink.files
+    assert "types/terms/xxx.py" not in sink.read_manifest(_DEST)[0]
+
+    report = _write(sink, path_to_java_impl, prune=True)
+    assert report.stale == []
+
+
+def test_write_does_not_prune_edited_stale_files(path_to_java_impl):
+    sink = sinks.MemorySink()
+    _write(sink, path_to_java_impl)
+    _add_stale(sink, "types/terms/xxx.py", "# Stale.\n", edited=True)
+
+    report = _write(sink, path_to_java_impl, prune=True)
+    assert report.stale == [_DEST / "types/terms/xxx.py"]
+    assert report.pruned == []
+    assert _DEST / "types/terms/xxx.py" in sink.files
+
+
+def test_selective_write_only_prunes_selected_files(path_to_java_impl):
+    sink = sinks.MemorySink()
+    _write(sink, path_to_java_impl)
+    _add_stale(sink, "types/terms/xxx.py", "# Stale.\n", source="Termset:PAM")
+    _add_stale(sink, "types/terms/yyy.py", "# Stale.\n", source="Termset:ANN")
+
+    report = _write(sink, path_to_java_impl, prune=True, contracts=["PAM"], generators=[TargetGenerator.Termset])
+    assert report.stale == [_DEST / "types/terms/xxx.py"]
+    assert report.pruned == [_DEST / "types/terms/xxx.py"]
+    assert _DEST / "types/terms/pam.py" in report.unchanged
+    assert _DEST / "types/terms/ann.py" not in report.unchanged
+
+    # Files falling outside of the selection are carried over.
+    files, sources = sink.read_manifest(_DEST)
+    assert "types/terms/xxx.py" not in files
+    assert sources["types/terms/yyy.py"] == "Termset:ANN"
+    assert "types/terms/ann.py" in files
+    assert _DEST / "types/terms/yyy.py" in sink.files
+
+
+def test_parallel_write_matches_serial_write(path_to_java_impl):
+    serial, parallel = sinks.MemorySink(), sinks.MemorySink()
+    _write(serial, path_to_java_impl)
+    _write(parallel, path_to_java_impl, jobs=2)
+
+    assert parallel.files == serial.files